@@ -21,13 +21,20 @@ copy_dir() {
     local label="$3"
     if [ -d "$src" ] && [ "$(ls -A "$src" 2>/dev/null)" ]; then
         echo "Copying $label..."
-        rsync -a "$src" "$dest"
+        rsync -a --exclude '*.journal' --exclude '*.refresh' --exclude '*.backup' --exclude '*.engagement.db' --exclude '*.images.json' "$src" "$dest"
         echo "$label copied successfully."
     else
         echo "No $label found, skipping..."
     fi
 }
 
+# Fold pending single-row changes into youtube.csv first, so rows deleted through the
+# journal are neither copied nor exported
+if [ -s src/data/youtube.csv.journal ]; then
+    echo "Applying pending YouTube CSV changes..."
+    python3 scripts/update_youtube_csv.py --offline --compact
+fi
+
 copy_dir src/images/ dist/images/ "images"
 copy_dir src/data/ dist/data/ "data"
 copy_dir src/firmware/ dist/firmware/ "firmware"
@@ -37,6 +44,13 @@ copy_dir src/openterface/scripts/ dist/openterface/scripts/ "openterface scripts
 copy_dir src/minikvm/ dist/minikvm/ "minikvm"
 copy_dir src/keymod/ dist/keymod/ "keymod"
 
+if command -v python3 >/dev/null 2>&1; then
+    echo "Exporting data CSVs as list/details JSON..."
+    python3 scripts/export_data_json.py --src src/data --out dist/data
+else
+    echo "python3 not found, skipping data JSON export..."
+fi
+
 echo "Generating list of image files to convert to WebP..."
 image_files=$(find src/images -type f \( -iname "*.png" -o -iname "*.jpg" -o -iname "*.jpeg" \) 2>/dev/null || true)
 
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+YouTube CSV Updater Benchmark
+
+Runs the full update_youtube_csv.py refresh (read, fetch, merge, write) against the
+local replay server for a generated CSV, once per worker count, and reports rows/sec,
+response bytes per row, client CPU time per row and the share of requests that reused
+a pooled connection. The server runs in a separate process so its CPU time is not counted.
+
+Usage:
+    python bench_youtube_csv.py [--rows 200] [--workers 1,4,8] [--latency 80] [--jitter 40] [--error-rate 0] [--json]
+"""
+
+import os
+import re
+import sys
+import csv
+import json
+import time
+import argparse
+import tempfile
+import contextlib
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from update_youtube_csv import AdaptiveRateLimiter, YouTubeCSVUpdater
+
+SCRIPT_DIR = Path(__file__).parent
+
+
+def start_replay_server(latency_ms: float, jitter_ms: float, error_rate: float) -> Tuple[subprocess.Popen, str]:
+    """Start youtube_replay_server.py on a free port; returns (process, base URL)."""
+    process = subprocess.Popen(
+        [sys.executable, str(SCRIPT_DIR / 'youtube_replay_server.py'), 'serve', '--port', '0', '--synthetic',
+         '--latency', str(latency_ms), '--jitter', str(jitter_ms), '--error-rate', str(error_rate)],
+        stdout=subprocess.PIPE, text=True,
+    )
+    line = process.stdout.readline()
+    match = re.search(r'(http://\S+)', line)
+    if not match:
+        process.kill()
+        raise RuntimeError(f"Replay server did not start: {line.strip()!r}")
+    return process, match.group(1)
+
+
+def write_bench_csv(path: Path, rows: int, prefix: str):
+    """CSV with `rows` URL-only rows; synthetic ids are 11 characters like real ones."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=YouTubeCSVUpdater.CSV_COLUMNS)
+        writer.writeheader()
+        for i in range(rows):
+            writer.writerow({'youtube_url': f"https://www.youtube.com/watch?v={prefix}{i:07d}"})
+
+
+def run_once(base_url: str, rows: int, workers: int, interval: float, prefix: str) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / 'youtube.csv'
+        write_bench_csv(csv_path, rows, prefix)
+        updater = YouTubeCSVUpdater(csv_path, workers=workers, base_url=base_url,
+                                    api_url='http://127.0.0.1:9/v1/chat/completions')
+        # Pacing is a production safeguard; by default it is disabled so the pipeline itself is measured
+        limiter = AdaptiveRateLimiter(initial_interval=interval, min_interval=interval, base_backoff=0.2)
+        updater.rate_limiter = updater.metadata_fetcher.rate_limiter = limiter
+
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            updater.update_csv()
+        wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            result_rows = list(csv.DictReader(f))
+        complete = sum(1 for row in result_rows if row.get('title') and row.get('comment_count'))
+
+    return {
+        'workers': workers,
+        'rows': rows,
+        'seconds': round(wall, 3),
+        'rows_per_sec': round(rows / wall, 2) if wall else 0.0,
+        'bytes_per_row': round(updater.metadata_fetcher.bytes_received / rows),
+        'cpu_ms_per_row': round(cpu * 1000 / rows, 3),
+        'retries': limiter.retries,
+        'connection_reuse': round(updater.http.connection_stats()['reuse_rate'], 3),
+        'complete_rows': complete,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark update_youtube_csv.py against the local replay server.')
+    parser.add_argument('--rows', type=int, default=200, help='Rows in the generated CSV (default: 200)')
+    parser.add_argument('--workers', default='1,4,8',
+                        help='Comma-separated worker counts to compare; 1 is the serial mode (default: 1,4,8)')
+    parser.add_argument('--latency', type=float, default=80.0, metavar='MS', help='Server latency per response (default: 80)')
+    parser.add_argument('--jitter', type=float, default=40.0, metavar='MS', help='Random extra latency (default: 40)')
+    parser.add_argument('--error-rate', type=float, default=0.0, metavar='P', help='Share of 429/503 responses (default: 0)')
+    parser.add_argument('--interval', type=float, default=0.0, metavar='SECONDS',
+                        help='Rate-limiter interval per endpoint (default: 0, no pacing)')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    worker_counts = [int(w) for w in args.workers.split(',') if w.strip()]
+    process, base_url = start_replay_server(args.latency, args.jitter, args.error_rate)
+    results: List[Dict[str, float]] = []
+    try:
+        for n, workers in enumerate(worker_counts):
+            if not args.json:
+                print(f"⏱️  {args.rows} rows, {workers} worker(s)...", flush=True)
+            results.append(run_once(base_url, args.rows, workers, args.interval, prefix=f"bn{n:02d}"))
+    finally:
+        process.terminate()
+        process.wait()
+
+    if args.json:
+        print(json.dumps({'latency_ms': args.latency, 'jitter_ms': args.jitter,
+                          'error_rate': args.error_rate, 'results': results}, indent=2))
+        return
+
+    print()
+    print(f"{'workers':>7} {'rows/s':>9} {'bytes/row':>10} {'cpu ms/row':>11} {'retries':>8} {'reuse':>6} {'complete':>9}")
+    for r in results:
+        print(f"{r['workers']:>7} {r['rows_per_sec']:>9.2f} {r['bytes_per_row']:>10} "
+              f"{r['cpu_ms_per_row']:>11.3f} {r['retries']:>8} {r['connection_reuse']:>6.0%} {r['complete_rows']:>5}/{r['rows']}")
+    if results and results[0]['rows_per_sec']:
+        for r in results[1:]:
+            print(f"  {r['workers']} workers: {r['rows_per_sec'] / results[0]['rows_per_sec']:.1f}x serial throughput")
+
+
+if __name__ == '__main__':
+    main()
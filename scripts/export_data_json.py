@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Export the data CSVs as compact JSON for the marketing sites.
+
+For each CSV in src/data/ this writes to dist/data/:
+  <name>.list.json     display columns only, stored column-wise, numbers as numbers,
+                       rows in display order
+  <name>.details.json  long text (descriptions, excerpts) by row id, to load on demand
+plus .gz (and .br when the brotli module is installed) copies of both, so the CDN can
+serve them precompressed. The CSVs themselves are still copied as before.
+
+Usage:
+    python scripts/export_data_json.py [--src src/data] [--out dist/data]
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import hashlib
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+YOUTUBE_ID_RE = re.compile(r"(?:youtube\.com/watch\?(?:.*&)?v=|youtu\.be/|youtube\.com/embed/)([^&\n?#/]+)")
+
+# Per CSV: list columns (output name -> source columns, first non-empty wins), detail
+# columns, integer columns, and sort order as (column, descending); blanks sort last.
+DATASETS: Dict[str, Dict] = {
+    "youtube": {
+        "list": {
+            "id": ["youtube_url"],
+            "url": ["youtube_url"],
+            "title": ["title"],
+            "author_name": ["author_name"],
+            "thumbnail": ["video_thumbnail_cdn", "video_thumbnail_url"],
+            "avatar": ["author_avatar_cdn", "thumbnail_url"],
+            "date": ["date"],
+            "views": ["views"],
+            "like_count": ["like_count"],
+            "comment_count": ["comment_count"],
+            "format": ["format"],
+            "language": ["language"],
+            "product": ["product"],
+            "z_index": ["z_index"],
+            "action_status": ["action_status"],
+        },
+        "details": ["description", "fetch_date"],
+        "numbers": {"views", "like_count", "comment_count", "z_index", "action_status"},
+        "sort": [("z_index", True), ("date", True)],
+    },
+    "social-posts": {
+        "list": {
+            "id": ["id"],
+            "url": ["url"],
+            "platform": ["platform"],
+            "format": ["format"],
+            "product": ["product"],
+            "author": ["author"],
+            "title": ["title"],
+            "scenario_tag": ["scenario_tag"],
+            "language": ["language"],
+            "date": ["date"],
+            "featured_placements": ["featured_placements"],
+            "sort": ["sort"],
+            "z_index": ["z_index"],
+            "thumbnail": ["thumbnail_cdn", "thumbnail_override"],
+            "avatar": ["author_avatar_cdn"],
+            "like_count": ["like_count"],
+            "comment_count": ["comment_count"],
+            "action_status": ["action_status"],
+        },
+        "details": ["excerpt", "fetch_date", "fetch_status"],
+        "numbers": {"sort", "z_index", "like_count", "comment_count", "action_status"},
+        "sort": [("sort", False), ("date", True)],
+    },
+}
+
+
+def read_rows(csv_path: Path) -> List[Dict[str, str]]:
+    with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def to_number(value: str) -> Optional[int]:
+    value = (value or "").strip().replace(",", "")
+    try:
+        return int(float(value)) if value else None
+    except ValueError:
+        return None
+
+
+def row_id(name: str, row: Dict[str, str]) -> str:
+    if name == "youtube":
+        match = YOUTUBE_ID_RE.search(row.get("youtube_url", ""))
+        return match.group(1) if match else row.get("youtube_url", "")
+    return row.get("id", "")
+
+
+def list_record(name: str, spec: Dict, row: Dict[str, str]) -> Dict[str, object]:
+    record: Dict[str, object] = {}
+    for column, sources in spec["list"].items():
+        if column == "id":
+            record[column] = row_id(name, row)
+            continue
+        value = next((row.get(s, "").strip() for s in sources if row.get(s, "").strip()), "")
+        record[column] = to_number(value) if column in spec["numbers"] else (value or None)
+    return record
+
+
+def sort_records(records: List[Dict[str, object]], order: List[Tuple[str, bool]]) -> List[Dict[str, object]]:
+    # Stable sorts from the least to the most significant key; blanks always go last
+    for column, descending in reversed(order):
+        present = [r for r in records if r.get(column) is not None]
+        missing = [r for r in records if r.get(column) is None]
+        present.sort(key=lambda r: r[column], reverse=descending)
+        records = present + missing
+    return records
+
+
+def export_dataset(name: str, spec: Dict, csv_path: Path, out_dir: Path) -> Dict[str, object]:
+    """Write the list/details files (and compressed copies) for one CSV; returns timings and sizes."""
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+    rows = [row for row in read_rows(csv_path) if any((v or "").strip() for v in row.values())]
+    # Identifies the data instead of a build time, so the same CSV always exports the same bytes
+    source = hashlib.sha256(csv_path.read_bytes()).hexdigest()[:16]
+    timings["read_ms"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    records = sort_records([list_record(name, spec, row) for row in rows], spec["sort"])
+    columns = list(spec["list"])
+    listing = {
+        "version": 1,
+        "source": source,
+        "count": len(records),
+        "details": f"{name}.details.json",
+        "columns": columns,
+        "data": {column: [record[column] for record in records] for column in columns},
+    }
+    details = {
+        "version": 1,
+        "source": source,
+        "columns": spec["details"],
+        "rows": {row_id(name, row): [row.get(c, "") for c in spec["details"]] for row in rows},
+    }
+    timings["build_ms"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    sizes: Dict[str, int] = {"csv": csv_path.stat().st_size}
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for kind, payload in (("list", listing), ("details", details)):
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        path = out_dir / f"{name}.{kind}.json"
+        path.write_bytes(body)
+        sizes[kind] = len(body)
+        # mtime=0 keeps the .gz byte-identical across builds of the same data
+        compressed = gzip.compress(body, compresslevel=9, mtime=0)
+        path.with_name(path.name + ".gz").write_bytes(compressed)
+        sizes[f"{kind}.gz"] = len(compressed)
+        if brotli is not None:
+            compressed = brotli.compress(body, quality=11)
+            path.with_name(path.name + ".br").write_bytes(compressed)
+            sizes[f"{kind}.br"] = len(compressed)
+    timings["write_ms"] = (time.perf_counter() - start) * 1000
+    return {"rows": len(records), "timings": timings, "sizes": sizes}
+
+
+def main() -> int:
+    project_root = Path(__file__).resolve().parent.parent
+    parser = argparse.ArgumentParser(description="Export the data CSVs as compact list/details JSON")
+    parser.add_argument("--src", type=Path, default=project_root / "src" / "data", help="Directory with the CSVs")
+    parser.add_argument("--out", type=Path, default=project_root / "dist" / "data", help="Output directory")
+    args = parser.parse_args()
+
+    total_start = time.perf_counter()
+    exported = 0
+    for name, spec in DATASETS.items():
+        csv_path = args.src / f"{name}.csv"
+        if not csv_path.exists():
+            print(f"Skipping {name}: {csv_path} not found")
+            continue
+        journal = csv_path.with_suffix(".csv.journal")
+        if journal.exists() and journal.stat().st_size:
+            print(f"Warning: {journal} has pending changes that this export lacks; "
+                  f"run update_youtube_csv.py --compact first")
+        result = export_dataset(name, spec, csv_path, args.out)
+        t, s = result["timings"], result["sizes"]
+        compressed = f"{s['list.br']} B br" if "list.br" in s else f"{s['list.gz']} B gz"
+        print(f"Exported {name}: {result['rows']} rows, list {s['list']} B ({compressed}), "
+              f"details {s['details']} B, csv {s['csv']} B "
+              f"[read {t['read_ms']:.1f} ms, build {t['build_ms']:.1f} ms, write {t['write_ms']:.1f} ms]")
+        exported += 1
+    if brotli is None:
+        print("Note: brotli module not installed, wrote .gz only")
+    print(f"Data export finished in {(time.perf_counter() - total_start) * 1000:.1f} ms ({exported} datasets)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -38,6 +38,9 @@ EXCLUDE_NAMES = {
     "favicon.svg",
 }
 
+# Precompressed copies written next to a file (export_data_json.py); not listed separately
+PRECOMPRESSED_SUFFIXES = (".gz", ".br")
+
 IMAGE_EXTENSIONS = {".webp", ".svg", ".png", ".jpg", ".jpeg", ".gif"}
 RASTER_DEDUPE_EXTENSIONS = {".png", ".jpg", ".jpeg"}
 PREFERRED_RASTER = ".webp"
@@ -248,6 +251,8 @@ def scan_dist(dist_dir: Path) -> List[Path]:
         for name in filenames:
             if name in EXCLUDE_NAMES:
                 continue
+            if name.endswith(PRECOMPRESSED_SUFFIXES) and (Path(root) / name[:-3]).exists():
+                continue
             full = Path(root) / name
             try:
                 rel = full.relative_to(dist_dir)
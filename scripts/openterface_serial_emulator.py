@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Openterface Serial Emulator
+
+A stand-in for the control chip of an Openterface KVM (CH9329-style "57 AB" serial
+protocol) so the serial test and --serial-bench of sysinfo_inspector.py can be run on
+any Linux box. Each emulated device is a pseudo-terminal that answers commands with
+configurable latency, jitter, dropped replies, dropped or corrupted bytes, and what
+happens when the host opens it at the wrong baud rate.
+
+Next to the ptys it builds a fake sysfs and /dev in a temp directory, so the inspector's
+VID:PID lookup finds the devices: <tmp>/dev/ttyUSB0 links to the pty and
+<tmp>/sys/class/tty/ttyUSB0/device leads to a USB node with idVendor/idProduct. The
+inspector reads these instead of /sys and /dev when OPF_SYSFS_ROOT and OPF_DEV_DIR are
+set; the emulator prints them, or runs the command given after `--` with them set.
+
+Answered commands: GET_INFO (0x01), keyboard/media/mouse/custom HID reports (0x02-0x06),
+GET_PARA_CFG/SET_PARA_CFG (0x08/0x09), SET_DEFAULT_CFG (0x0C) and RESET (0x0F). Other
+commands get an error reply (0xE3); a bad checksum gets 0xE4.
+
+Usage:
+    python openterface_serial_emulator.py [--vidpid 1a86:7523] [--baud 9600] [--count 2]
+        [--latency 2] [--jitter 1] [--drop-rate 0.01] [--byte-drop-rate 0.001] [--corrupt-rate 0.001]
+        [--baud-mismatch garble|silent|answer]
+
+    # run the inspector against it and exit with its status
+    python openterface_serial_emulator.py --baud 115200 -- \\
+        python3 ../src/openterface/scripts/sysinfo_inspector.py --serial-bench 500
+"""
+
+import os
+import sys
+import time
+import random
+import select
+import shutil
+import termios
+import argparse
+import tempfile
+import threading
+import subprocess
+from typing import Dict, List, Optional, Tuple
+
+HEADER = b'\x57\xab'
+MAX_DATA = 64
+
+CMD_GET_INFO = 0x01
+CMD_SEND_KB_GENERAL_DATA = 0x02
+CMD_SEND_KB_MEDIA_DATA = 0x03
+CMD_SEND_MS_ABS_DATA = 0x04
+CMD_SEND_MS_REL_DATA = 0x05
+CMD_SEND_MY_HID_DATA = 0x06
+CMD_GET_PARA_CFG = 0x08
+CMD_SET_PARA_CFG = 0x09
+CMD_SET_DEFAULT_CFG = 0x0C
+CMD_RESET = 0x0F
+
+STATUS_SUCCESS = 0x00
+STATUS_CMD_ERROR = 0xE3
+STATUS_CHECKSUM_ERROR = 0xE4
+
+# Commands acknowledged with a one-byte success status
+ACK_COMMANDS = {CMD_SEND_KB_GENERAL_DATA, CMD_SEND_KB_MEDIA_DATA, CMD_SEND_MS_ABS_DATA, CMD_SEND_MS_REL_DATA,
+                CMD_SEND_MY_HID_DATA, CMD_SET_PARA_CFG, CMD_SET_DEFAULT_CFG, CMD_RESET}
+
+# termios speed constant -> baud rate
+TERMIOS_SPEEDS = {getattr(termios, f'B{rate}'): rate for rate in (1200, 2400, 4800, 9600, 19200, 38400, 57600,
+                                                                   115200, 230400, 460800, 921600)
+                  if hasattr(termios, f'B{rate}')}
+
+# Which tty name and driver a VID:PID gets in the fake sysfs
+TTY_KINDS = {
+    ('1a86', '7523'): ('ttyUSB', 'ch341', 'QinHeng Electronics', 'USB Serial'),
+    ('1a86', 'fe0c'): ('ttyACM', 'cdc_acm', 'Openterface', 'Openterface Serial'),
+}
+
+
+def frame(cmd: int, data: bytes = b'', addr: int = 0x00) -> bytes:
+    body = HEADER + bytes([addr, cmd, len(data)]) + data
+    return body + bytes([sum(body) & 0xFF])
+
+
+def split_frames(buf: bytearray) -> List[Tuple[bytes, bool]]:
+    """Take the complete frames off the front of `buf`; returns (frame, checksum ok) pairs."""
+    frames = []
+    while True:
+        start = buf.find(HEADER)
+        if start < 0:
+            del buf[:len(buf) - (1 if buf.endswith(HEADER[:1]) else 0)]
+            return frames
+        del buf[:start]
+        if len(buf) < 5:
+            return frames
+        if buf[4] > MAX_DATA:
+            del buf[:2]
+            continue
+        size = 6 + buf[4]
+        if len(buf) < size:
+            return frames
+        raw = bytes(buf[:size])
+        del buf[:size]
+        frames.append((raw, sum(raw[:-1]) & 0xFF == raw[-1]))
+
+
+class EmulatedDevice:
+    """One pty answering the 57 AB protocol, served from its own thread."""
+
+    def __init__(self, args, index: int):
+        self.args = args
+        self.baud = args.baud
+        self.master, self.slave = os.openpty()
+        self.pty = os.ttyname(self.slave)
+        self.random = random.Random(args.seed + index if args.seed is not None else None)
+        self.stats = {'frames': 0, 'answered': 0, 'dropped': 0, 'bytes_dropped': 0, 'corrupted': 0,
+                      'checksum_errors': 0, 'baud_mismatches': 0}
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+
+    def host_baud(self) -> Optional[int]:
+        # a pty master reports the termios of its slave, i.e. what the host configured
+        return TERMIOS_SPEEDS.get(termios.tcgetattr(self.master)[5])
+
+    def reply_for(self, raw: bytes, checksum_ok: bool) -> bytes:
+        addr, cmd, data = raw[2], raw[3], raw[5:-1]
+        if not checksum_ok:
+            self.stats['checksum_errors'] += 1
+            return frame(cmd | 0xC0, bytes([STATUS_CHECKSUM_ERROR]), addr)
+        if cmd == CMD_GET_INFO:
+            leds = self.args.leds
+            return frame(cmd | 0x80, bytes([self.args.chip_version, 0x01 if self.args.target_usb else 0x00, leds, 0, 0, 0, 0, 0]), addr)
+        if cmd == CMD_GET_PARA_CFG:
+            # work mode, serial mode, address, baud (big endian), then the rest of the 50 bytes
+            return frame(cmd | 0x80, bytes([0x80, 0x80, addr]) + self.baud.to_bytes(4, 'big') + bytes(43), addr)
+        if cmd == CMD_SET_PARA_CFG and len(data) >= 7:
+            self.baud = int.from_bytes(data[3:7], 'big') or self.baud
+        if cmd in ACK_COMMANDS:
+            return frame(cmd | 0x80, bytes([STATUS_SUCCESS]), addr)
+        return frame(cmd | 0xC0, bytes([STATUS_CMD_ERROR]), addr)
+
+    def impair(self, reply: bytes) -> bytes:
+        """Apply the byte-level faults: drop or flip single bytes."""
+        out = bytearray()
+        for byte in reply:
+            if self.random.random() < self.args.byte_drop_rate:
+                self.stats['bytes_dropped'] += 1
+                continue
+            if self.random.random() < self.args.corrupt_rate:
+                self.stats['corrupted'] += 1
+                byte ^= 1 << self.random.randrange(8)
+            out.append(byte)
+        return bytes(out)
+
+    def serve(self):
+        buf = bytearray()
+        pending: List[Tuple[float, bytes]] = []
+        line_free = 0.0
+        while not self.stopped.is_set():
+            now = time.monotonic()
+            while pending and pending[0][0] <= now:
+                try:
+                    os.write(self.master, pending.pop(0)[1])
+                except OSError:
+                    return
+            timeout = min(pending[0][0] - now, 0.2) if pending else 0.2
+            ready, _, _ = select.select([self.master], [], [], max(0.0, timeout))
+            if not ready:
+                continue
+            try:
+                chunk = os.read(self.master, 4096)
+            except OSError:
+                return
+            host_baud = self.host_baud()
+            if host_baud and host_baud != self.baud:
+                # bytes sent at the wrong rate arrive as framing errors on a real UART
+                self.stats['baud_mismatches'] += 1
+                if self.args.baud_mismatch == 'silent':
+                    continue
+                if self.args.baud_mismatch == 'garble':
+                    pending.append((time.monotonic() + self.args.latency / 1000,
+                                    bytes(self.random.randrange(256) for _ in range(len(chunk)))))
+                    continue
+            buf += chunk
+            received = time.monotonic()
+            for raw, checksum_ok in split_frames(buf):
+                self.stats['frames'] += 1
+                if self.random.random() < self.args.drop_rate:
+                    self.stats['dropped'] += 1
+                    continue
+                reply = self.impair(self.reply_for(raw, checksum_ok))
+                delay = (self.args.latency + self.random.uniform(-self.args.jitter, self.args.jitter)) / 1000
+                due = received + max(0.0, delay)
+                if not self.args.no_wire_delay:
+                    # the command and reply each take 10 bits per byte on the wire at our baud
+                    due = max(due + len(raw) * 10 / self.baud, line_free) + len(reply) * 10 / self.baud
+                    line_free = due
+                # replies leave in order, whatever their jitter
+                due = max(due, pending[-1][0] if pending else 0.0)
+                pending.append((due, reply))
+                self.stats['answered'] += 1
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join(timeout=1)
+        for fd in (self.master, self.slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+def build_fake_tree(root: str, devices: List[EmulatedDevice], vid: str, pid: str) -> Dict[str, str]:
+    """Create <root>/sys and <root>/dev describing each device as a USB-serial adapter on bus 1.
+
+    Returns {tty name: pty path}.
+    """
+    prefix, driver, manufacturer, product = TTY_KINDS.get((vid, pid), ('ttyUSB', 'usbserial', 'Emulated', 'Serial'))
+    sys_dir = os.path.join(root, 'sys')
+    dev_dir = os.path.join(root, 'dev')
+    controller = os.path.join(sys_dir, 'devices', 'pci0000:00', '0000:00:14.0', 'usb1')
+    os.makedirs(os.path.join(sys_dir, 'class', 'tty'))
+    os.makedirs(os.path.join(sys_dir, 'bus', 'usb', 'devices'))
+    os.makedirs(dev_dir)
+
+    def write_attrs(path: str, attrs: Dict[str, str]):
+        os.makedirs(path, exist_ok=True)
+        for name, value in attrs.items():
+            with open(os.path.join(path, name), 'w') as f:
+                f.write(value + '\n')
+        os.symlink(path, os.path.join(sys_dir, 'bus', 'usb', 'devices', os.path.basename(path)))
+
+    write_attrs(controller, {'idVendor': '1d6b', 'idProduct': '0002', 'product': 'xHCI Host Controller', 'busnum': '1', 'devnum': '1',
+                             'uevent': 'DEVTYPE=usb_device\nDRIVER=usb\nPRODUCT=1d6b/2/606\nBUSNUM=001\nDEVNUM=001'})
+    ttys = {}
+    for index, device in enumerate(devices):
+        name = f'1-{index + 2}'
+        node = os.path.join(controller, name)
+        write_attrs(node, {
+            'idVendor': vid, 'idProduct': pid, 'manufacturer': manufacturer, 'product': product,
+            'busnum': '1', 'devnum': str(index + 2), 'devpath': str(index + 2),
+            'uevent': f'DEVTYPE=usb_device\nDRIVER=usb\nPRODUCT={int(vid, 16):x}/{int(pid, 16):x}/264\n'
+                      f'BUSNUM=001\nDEVNUM={index + 2:03d}',
+        })
+        interface = os.path.join(node, f'{name}:1.0')
+        write_attrs(interface, {'uevent': f'DEVTYPE=usb_interface\nDRIVER={driver}\nPRODUCT={int(vid, 16):x}/{int(pid, 16):x}/264'})
+        tty = f'{prefix}{index}'
+        os.makedirs(os.path.join(interface, tty))
+        os.makedirs(os.path.join(sys_dir, 'class', 'tty', tty))
+        os.symlink(interface, os.path.join(sys_dir, 'class', 'tty', tty, 'device'))
+        os.symlink(device.pty, os.path.join(dev_dir, tty))
+        ttys[tty] = device.pty
+    return ttys
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Emulate Openterface serial control chips on ptys for sysinfo_inspector.py.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--vidpid', default='1a86:7523', help='VID:PID reported in the fake sysfs (default: 1a86:7523)')
+    parser.add_argument('--count', type=int, default=1, help='Number of devices to emulate (default: 1)')
+    parser.add_argument('--baud', type=int, default=9600, help='Baud rate the device listens at (default: 9600)')
+    parser.add_argument('--baud-mismatch', choices=['garble', 'silent', 'answer'], default='garble',
+                        help='When the host tty is set to another rate: reply with noise (default), stay silent, or answer anyway')
+    parser.add_argument('--latency', type=float, default=1.0, metavar='MS', help='Processing delay per command in milliseconds')
+    parser.add_argument('--jitter', type=float, default=0.0, metavar='MS', help='Random +/- variation of the latency in milliseconds')
+    parser.add_argument('--drop-rate', type=float, default=0.0, metavar='P', help='Probability of not answering a command (0-1)')
+    parser.add_argument('--byte-drop-rate', type=float, default=0.0, metavar='P', help='Probability of losing each reply byte (0-1)')
+    parser.add_argument('--corrupt-rate', type=float, default=0.0, metavar='P', help='Probability of flipping a bit in each reply byte (0-1)')
+    parser.add_argument('--no-wire-delay', action='store_true', help='Do not pace traffic at 10 bits per byte at --baud')
+    parser.add_argument('--chip-version', type=lambda v: int(v, 0), default=0x31, help='Version byte of GET_INFO replies (default: 0x31 = V1.1)')
+    parser.add_argument('--target-usb', type=int, choices=[0, 1], default=1, help='Target USB status in GET_INFO replies (default: 1, connected)')
+    parser.add_argument('--leds', type=lambda v: int(v, 0), default=0x00, help='Keyboard LED bits in GET_INFO replies (1 num, 2 caps, 4 scroll)')
+    parser.add_argument('--seed', type=int, help='Random seed for reproducible faults')
+    parser.epilog = 'Anything after -- is run with OPF_SYSFS_ROOT/OPF_DEV_DIR set; the emulator then exits with its status.'
+    argv = sys.argv[1:]
+    command = argv[argv.index('--') + 1:] if '--' in argv else []
+    args = parser.parse_args(argv[:len(argv) - len(command) - 1] if '--' in argv else argv)
+
+    vid, _, pid = args.vidpid.lower().partition(':')
+    if not (vid and pid):
+        print(f"❌ --vidpid must look like 1a86:7523, got {args.vidpid}")
+        sys.exit(1)
+
+    root = tempfile.mkdtemp(prefix='opf-serial-emu-')
+    devices = [EmulatedDevice(args, index) for index in range(max(1, args.count))]
+    ttys: Dict[str, str] = {}
+    try:
+        ttys = build_fake_tree(root, devices, vid, pid)
+        for device in devices:
+            device.start()
+        env = {'OPF_SYSFS_ROOT': os.path.join(root, 'sys'), 'OPF_DEV_DIR': os.path.join(root, 'dev')}
+        for tty, pty in ttys.items():
+            print(f"🔌 {os.path.join(env['OPF_DEV_DIR'], tty)} -> {pty}  [{vid}:{pid}] at {args.baud} baud")
+
+        if command:
+            status = subprocess.call(command, env={**os.environ, **env})
+        else:
+            print(' '.join(f'{k}={v}' for k, v in env.items()) +
+                  ' python3 src/openterface/scripts/sysinfo_inspector.py --serial-test')
+            print("Press Ctrl-C to stop")
+            status = 0
+            try:
+                while True:
+                    time.sleep(3600)
+            except KeyboardInterrupt:
+                pass
+    finally:
+        for device in devices:
+            device.stop()
+        shutil.rmtree(root, ignore_errors=True)
+    for tty, device in zip(ttys, devices):
+        print(f"📊 {tty}: " + ', '.join(f'{k} {v}' for k, v in device.stats.items()), file=sys.stderr)
+    sys.exit(status)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,618 @@
+#!/usr/bin/env python3
+"""
+Social Posts CSV Updater
+
+Refreshes like/comment counts (and fills empty author, text and date fields) in
+src/data/social-posts.csv. Each platform is handled by an adapter; all of them share
+the connection pool, adaptive rate limiter and image mirror of update_youtube_csv.py.
+
+Refreshes are incremental by fetch_status:
+    (empty), error  fetched on every run
+    ok              fetched with --force, or --older-than AGE by fetch_date
+    manual          hand-curated rows, fetched only with --include-manual (text fields
+                    are never overwritten and the status stays 'manual')
+
+Usage:
+    python update_social_posts_csv.py [--force | --older-than 7d] [--include-manual] [--platform x]
+    python update_social_posts_csv.py --mirror-images
+    python update_social_posts_csv.py --base-url http://127.0.0.1:8765   # replay server fixtures
+    python update_social_posts_csv.py --check-fixtures   # adapters vs. fixtures/social/expected.json
+"""
+
+import os
+import re
+import sys
+import csv
+import html
+import json
+import math
+import time
+import argparse
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import requests
+
+from update_youtube_csv import (AdaptiveRateLimiter, HTTPClient, Image, ImageMirror,
+                                YouTubeCSVUpdater, YouTubeMetadataFetcher)
+
+DEFAULT_CSV_PATH = Path(__file__).parent.parent / 'src' / 'data' / 'social-posts.csv'
+FIXTURE_DIR = Path(__file__).parent / 'fixtures' / 'social'
+# Fields each fixture URL should parse to (None for posts that are gone)
+EXPECTED_PATH = FIXTURE_DIR / 'expected.json'
+
+
+def parse_count(text: str) -> str:
+    """'1,234' / '1.2K' / '3M' -> '1234' / '1200' / '3000000'; '' if not a count."""
+    text = (text or '').strip().replace(',', '').upper()
+    match = re.fullmatch(r'(\d+(?:\.\d+)?)([KMB]?)', text)
+    if not match:
+        return ''
+    scale = {'': 1, 'K': 1_000, 'M': 1_000_000, 'B': 1_000_000_000}[match.group(2)]
+    return str(int(float(match.group(1)) * scale))
+
+
+class PlatformAdapter(ABC):
+    """Fetches one platform's post data.
+
+    Subclasses set `name` (the CSV's platform value and the rate-limiter endpoint) and
+    implement `post_id()` and `fetch()`. `fetch()` returns a dict with any of like_count,
+    comment_count, author, title, excerpt, date, thumbnail_url and avatar_url, or None if
+    the post is gone or the response could not be parsed.
+    """
+
+    name = ''
+    DEFAULT_BASE_URL = ''
+
+    def __init__(self, http: HTTPClient, rate_limiter: AdaptiveRateLimiter, base_url: Optional[str] = None):
+        self.http = http
+        self.rate_limiter = rate_limiter
+        self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip('/')
+        self.cache: Dict[str, Optional[Dict[str, str]]] = {}
+
+    @abstractmethod
+    def post_id(self, url: str) -> Optional[str]:
+        """The post's id on the platform, or None if `url` is not one of its posts."""
+
+    def matches(self, url: str) -> bool:
+        return self.post_id(url) is not None
+
+    @abstractmethod
+    def fetch(self, url: str) -> Optional[Dict[str, str]]:
+        """Fetch the post's fields; see the class docstring."""
+
+    def fetch_cached(self, url: str) -> Optional[Dict[str, str]]:
+        """fetch() with failures left uncached, so the next run retries them."""
+        if url not in self.cache:
+            result = self.fetch(url)
+            if result is None:
+                return None
+            self.cache[url] = result
+        return self.cache[url]
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('timeout', 15)
+        return self.rate_limiter.request(self.name, lambda: self.http.get(self.name, url, **kwargs))
+
+
+class XAdapter(PlatformAdapter):
+    """X/Twitter posts via the public embed syndication endpoint (no login or API key)."""
+
+    name = 'x'
+    DEFAULT_BASE_URL = 'https://cdn.syndication.twimg.com'
+
+    def post_id(self, url: str) -> Optional[str]:
+        match = re.search(r'(?:twitter|x)\.com/[^/]+/status(?:es)?/(\d+)', url)
+        return match.group(1) if match else None
+
+    @staticmethod
+    def token(tweet_id: str) -> str:
+        """The embed widget's token: (id / 1e15 * pi) in base 36, without zeros and the point."""
+        value = int(tweet_id) / 1e15 * math.pi
+        digits = '0123456789abcdefghijklmnopqrstuvwxyz'
+        whole, frac = int(value), value - int(value)
+        out = ''
+        while whole:
+            whole, digit = divmod(whole, 36)
+            out = digits[digit] + out
+        out = out or '0'
+        for _ in range(12):
+            frac *= 36
+            out += digits[int(frac)]
+            frac -= int(frac)
+        return out.replace('0', '')
+
+    def fetch(self, url: str) -> Optional[Dict[str, str]]:
+        tweet_id = self.post_id(url)
+        response = self._get(f"{self.base_url}/tweet-result?id={tweet_id}&lang=en&token={self.token(tweet_id)}")
+        if response.status_code != 200 or not response.content:
+            return None
+        data = response.json()
+        if data.get('__typename') == 'TweetTombstone' or 'favorite_count' not in data:
+            return None
+        user = data.get('user') or {}
+        text = re.sub(r'\s*https://t\.co/\w+\s*$', '', data.get('text', '')).strip()
+        media = data.get('mediaDetails') or []
+        thumbnail = (media[0].get('media_url_https', '') if media
+                     else ((data.get('video') or {}).get('poster', '')))
+        handle = user.get('screen_name', '')
+        return {
+            'like_count': str(data.get('favorite_count', '')),
+            'comment_count': str(data.get('conversation_count', '')),
+            'author': f"{user.get('name', handle)} (@{handle})" if handle else '',
+            'excerpt': html.unescape(text),
+            'date': data.get('created_at', '')[:10],
+            'thumbnail_url': thumbnail,
+            'avatar_url': user.get('profile_image_url_https', '').replace('_normal.', '_400x400.'),
+        }
+
+
+class BlueskyAdapter(PlatformAdapter):
+    """Bluesky posts via the public AppView XRPC API."""
+
+    name = 'bluesky'
+    DEFAULT_BASE_URL = 'https://public.api.bsky.app'
+
+    POST_URL_RE = re.compile(r'bsky\.app/profile/([^/]+)/post/([A-Za-z0-9]+)')
+
+    def post_id(self, url: str) -> Optional[str]:
+        match = self.POST_URL_RE.search(url)
+        return match.group(2) if match else None
+
+    def _resolve_did(self, actor: str) -> Optional[str]:
+        if actor.startswith('did:'):
+            return actor
+        response = self._get(f"{self.base_url}/xrpc/com.atproto.identity.resolveHandle?handle={quote(actor)}")
+        return response.json().get('did') if response.status_code == 200 else None
+
+    def fetch(self, url: str) -> Optional[Dict[str, str]]:
+        match = self.POST_URL_RE.search(url)
+        if not match:
+            return None
+        actor, rkey = match.groups()
+        did = self._resolve_did(actor)
+        if not did:
+            return None
+        uri = f"at://{did}/app.bsky.feed.post/{rkey}"
+        response = self._get(f"{self.base_url}/xrpc/app.bsky.feed.getPosts?uris={quote(uri, safe='')}")
+        if response.status_code != 200:
+            return None
+        posts = response.json().get('posts') or []
+        if not posts:
+            return None
+        post = posts[0]
+        author = post.get('author') or {}
+        record = post.get('record') or {}
+        embed = post.get('embed') or {}
+        images = embed.get('images') or (embed.get('media') or {}).get('images') or []
+        thumbnail = images[0].get('thumb', '') if images else (embed.get('external') or {}).get('thumb', '')
+        handle = author.get('handle', '')
+        return {
+            'like_count': str(post.get('likeCount', '')),
+            'comment_count': str(post.get('replyCount', '')),
+            'author': f"{author.get('displayName') or handle} (@{handle})" if handle else '',
+            'excerpt': record.get('text', ''),
+            'date': record.get('createdAt', '')[:10],
+            'thumbnail_url': thumbnail,
+            'avatar_url': author.get('avatar', ''),
+        }
+
+
+class InstagramAdapter(PlatformAdapter):
+    """Instagram posts and reels from the Open Graph tags of the public post page."""
+
+    name = 'instagram'
+    DEFAULT_BASE_URL = 'https://www.instagram.com'
+    # og:description reads '45 likes, 2 comments - 463n7 on June 2, 2026: "caption"'
+    DESCRIPTION_RE = re.compile(
+        r'^([\d.,]+[KMB]?) likes?, ([\d.,]+[KMB]?) comments? - (\S+) on ([A-Z][a-z]+ \d{1,2}, \d{4})(?:: "(.*)")?',
+        re.S)
+
+    def post_id(self, url: str) -> Optional[str]:
+        match = re.search(r'instagram\.com/(?:[^/]+/)?(?:p|reel|tv)/([A-Za-z0-9_-]+)', url)
+        return match.group(1) if match else None
+
+    @staticmethod
+    def _meta(page: str, prop: str) -> str:
+        match = re.search(rf'<meta[^>]+property="{prop}"[^>]+content="([^"]*)"', page)
+        return html.unescape(match.group(1)) if match else ''
+
+    def fetch(self, url: str) -> Optional[Dict[str, str]]:
+        kind = 'reel' if '/reel/' in url else 'p'
+        response = self._get(f"{self.base_url}/{kind}/{self.post_id(url)}/")
+        if response.status_code != 200:
+            return None
+        page = response.text
+        match = self.DESCRIPTION_RE.match(self._meta(page, 'og:description'))
+        if not match:
+            # Login wall or a changed page layout
+            return None
+        likes, comments, handle, posted, caption = match.groups()
+        try:
+            date = datetime.strptime(posted, '%B %d, %Y').strftime('%Y-%m-%d')
+        except ValueError:
+            date = ''
+        return {
+            'like_count': parse_count(likes),
+            'comment_count': parse_count(comments),
+            'author': f"@{handle}",
+            'excerpt': (caption or '').strip(),
+            'date': date,
+            'thumbnail_url': self._meta(page, 'og:image'),
+        }
+
+
+class YouTubeAdapter(PlatformAdapter):
+    """YouTube videos through update_youtube_csv.py's metadata fetcher."""
+
+    name = 'youtube'
+    DEFAULT_BASE_URL = YouTubeMetadataFetcher.DEFAULT_BASE_URL
+
+    def __init__(self, http: HTTPClient, rate_limiter: AdaptiveRateLimiter, base_url: Optional[str] = None):
+        super().__init__(http, rate_limiter, base_url)
+        self.fetcher = YouTubeMetadataFetcher(rate_limiter=rate_limiter, base_url=self.base_url, http=http)
+
+    def post_id(self, url: str) -> Optional[str]:
+        return self.fetcher.extract_video_id(url)
+
+    def fetch(self, url: str) -> Optional[Dict[str, str]]:
+        metadata = self.fetcher.fetch_video_metadata(self.post_id(url))
+        if not metadata.get('title'):
+            return None
+        return {
+            'like_count': metadata.get('like_count', ''),
+            'comment_count': metadata.get('comment_count', ''),
+            'author': metadata.get('author_name', ''),
+            'title': metadata.get('title', ''),
+            'excerpt': metadata.get('description', ''),
+            'date': metadata.get('date', ''),
+            'thumbnail_url': metadata.get('video_thumbnail_url', ''),
+            'avatar_url': metadata.get('thumbnail_url', ''),
+        }
+
+
+ADAPTERS = [XAdapter, BlueskyAdapter, InstagramAdapter, YouTubeAdapter]
+
+
+class SocialPostsUpdater:
+    """Incremental refresh of social-posts.csv through the platform adapters."""
+
+    # Overwritten on every successful fetch
+    COUNT_FIELDS = ['like_count', 'comment_count']
+    # Only filled while empty; these are usually edited by hand
+    TEXT_FIELDS = ['author', 'title', 'excerpt', 'date']
+    STATUS_OK, STATUS_ERROR, STATUS_MANUAL = 'ok', 'error', 'manual'
+
+    def __init__(self, csv_path: Path, dry_run: bool = False, verbose: bool = False, proxy: str = None,
+                 workers: int = 4, max_retries: int = 4, base_url: Optional[str] = None, force: bool = False,
+                 older_than=None, include_manual: bool = False, platforms: Optional[List[str]] = None):
+        self.csv_path = csv_path
+        self.dry_run = dry_run
+        self.verbose = verbose
+        self.force = force
+        self.older_than = older_than
+        self.include_manual = include_manual
+        self.platforms = platforms
+        self.workers = max(1, workers)
+        self.rate_limiter = AdaptiveRateLimiter(max_retries=max_retries)
+        self.http = HTTPClient(pool_size=self.workers, proxy=proxy)
+        # With base_url (the replay server), YouTube keeps its usual paths and every
+        # other platform is served under /social/<platform>
+        self.adapters = {
+            cls.name: cls(self.http, self.rate_limiter,
+                          base_url and (base_url.rstrip('/') if cls is YouTubeAdapter
+                                        else f"{base_url.rstrip('/')}/social/{cls.name}"))
+            for cls in ADAPTERS
+        }
+        self.columns: List[str] = []
+        self.rows: List[Dict[str, str]] = []
+        # Fetch results of this run by row id, for --mirror-images
+        self.fetched: Dict[str, Dict[str, str]] = {}
+
+    def read_csv(self) -> List[Dict[str, str]]:
+        with open(self.csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.DictReader(f)
+            self.columns = list(reader.fieldnames or [])
+            self.rows = list(reader)
+        return self.rows
+
+    def write_csv(self):
+        if self.dry_run:
+            print(f"[DRY RUN] Would write {len(self.rows)} rows to {self.csv_path}")
+            return
+        tmp_path = self.csv_path.with_name(self.csv_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=self.columns, lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(self.rows)
+        os.replace(tmp_path, self.csv_path)
+        print(f"Updated CSV file: {self.csv_path}")
+
+    def adapter_for(self, row: Dict[str, str]) -> Optional[PlatformAdapter]:
+        adapter = self.adapters.get(row.get('platform', '').strip().lower())
+        if adapter is None:
+            adapter = next((a for a in self.adapters.values() if a.matches(row.get('url', ''))), None)
+        return adapter
+
+    @staticmethod
+    def now() -> str:
+        """fetch_date in the CSV's format, e.g. 2026-08-06T09:23:40.532Z."""
+        return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+    def is_stale(self, row: Dict[str, str]) -> bool:
+        if self.older_than is None:
+            return True
+        try:
+            fetched = datetime.fromisoformat(row.get('fetch_date', '').strip().replace('Z', '+00:00'))
+        except ValueError:
+            return True
+        if fetched.tzinfo is None:
+            fetched = fetched.replace(tzinfo=timezone.utc)
+        return datetime.now(timezone.utc) - fetched >= self.older_than
+
+    def skip_reason(self, row: Dict[str, str]) -> Optional[str]:
+        """Why the row is not fetched this run, or None if it is."""
+        adapter = self.adapter_for(row)
+        if adapter is None or not adapter.matches(row.get('url', '')):
+            return 'unsupported'
+        if self.platforms and adapter.name not in self.platforms:
+            return 'platform'
+        status = row.get('fetch_status', '').strip()
+        if status == self.STATUS_MANUAL and not self.include_manual:
+            return 'manual'
+        if status in ('', self.STATUS_ERROR):
+            return None
+        if not (self.force or self.older_than is not None or status == self.STATUS_MANUAL):
+            return 'fresh'
+        return None if self.is_stale(row) else 'fresh'
+
+    def apply(self, row: Dict[str, str], result: Optional[Dict[str, str]]):
+        """Merge a fetch result (None if the fetch failed) into the row."""
+        manual = row.get('fetch_status', '').strip() == self.STATUS_MANUAL
+        if result is None:
+            if not manual:
+                row['fetch_status'] = self.STATUS_ERROR
+            return
+        for field in self.COUNT_FIELDS:
+            if result.get(field) and field in row:
+                row[field] = result[field]
+        for field in self.TEXT_FIELDS:
+            if result.get(field) and field in row and not row[field].strip():
+                row[field] = result[field]
+        row['fetch_date'] = self.now()
+        if not manual:
+            row['fetch_status'] = self.STATUS_OK
+
+    def _fetch(self, row: Dict[str, str]) -> Tuple[Dict[str, str], Optional[Dict[str, str]]]:
+        try:
+            return row, self.adapter_for(row).fetch_cached(row['url'].strip())
+        except (requests.RequestException, ValueError) as e:
+            if self.verbose:
+                print(f"  ⚠️  {row.get('id')}: {e}")
+            return row, None
+        except Exception as e:
+            # A parser bug in one adapter must not abort the run and lose the rows fetched so far
+            print(f"  ⚠️  {row.get('id')}: {type(e).__name__} while fetching {row.get('url')}: {e}")
+            return row, None
+
+    def update_csv(self):
+        print("=" * 60)
+        print("Social Posts CSV Updater")
+        print("=" * 60)
+        rows = self.read_csv()
+        if not rows:
+            print("❌ No rows found in CSV file.")
+            return
+
+        targets, skipped = [], {}
+        for row in rows:
+            reason = self.skip_reason(row)
+            if reason:
+                skipped[reason] = skipped.get(reason, 0) + 1
+            else:
+                targets.append(row)
+        print(f"\n📊 {len(rows)} rows, {len(targets)} to fetch"
+              + (f" (skipped: {', '.join(f'{n} {r}' for r, n in sorted(skipped.items()))})" if skipped else ''))
+
+        start = time.time()
+        ok = failed = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for row, result in executor.map(self._fetch, targets):
+                self.apply(row, result)
+                if result is None:
+                    failed += 1
+                    print(f"  ❌ {row.get('id')}: no data ({row.get('url')})")
+                    continue
+                ok += 1
+                self.fetched[row.get('id', '')] = result
+                if self.verbose:
+                    print(f"  ✅ {row.get('id')}: {result.get('like_count') or '-'} likes, "
+                          f"{result.get('comment_count') or '-'} comments")
+        elapsed = time.time() - start
+
+        requests_made = sum(stats['requests'] for stats in self.rate_limiter.summary().values())
+        print(f"\n  ✅ Updated: {ok} rows")
+        if failed:
+            print(f"  ❌ Failed: {failed} rows (old counts kept; fetched again next run unless 'manual')")
+        print(f"  ⏱️  {elapsed:.1f}s, {requests_made:.0f} requests, {self.rate_limiter.retries} retries")
+        if self.verbose:
+            for name, stats in sorted(self.http.latency_summary().items()):
+                print(f"     {name}: {stats['requests']} requests, latency {HTTPClient.format_histogram(stats['histogram'])}")
+        if targets:
+            self.write_csv()
+
+    def mirror_images(self, images_dir: Optional[Path] = None, cdn_base_url: Optional[str] = None):
+        """Save post thumbnails and author avatars as WebP and point the *_cdn columns at them.
+
+        The thumbnail source is thumbnail_override if set, else the image fetched this
+        run; columns already on our own origin are left alone.
+        """
+        print("\n🖼️  Mirroring images")
+        if Image is None:
+            print("❌ Pillow is required for --mirror-images: pip install Pillow")
+            return
+        if not self.rows:
+            self.read_csv()
+        src_dir = self.csv_path.resolve().parent.parent
+        images_dir = (images_dir or src_dir / 'images' / 'social-posts').resolve()
+        try:
+            url_prefix = images_dir.relative_to(src_dir).as_posix()
+        except ValueError:
+            url_prefix = f"images/{images_dir.name}"
+        if cdn_base_url is None:
+            from generate_manifest import get_base_url
+            cdn_base_url = get_base_url(Path(__file__).resolve().parent.parent)
+        cdn_prefix = f"{cdn_base_url.rstrip('/')}/{url_prefix}"
+        mirror = ImageMirror(images_dir, self.csv_path.with_suffix('.images.json'), self.http,
+                             self.rate_limiter, dry_run=self.dry_run)
+
+        def is_ours(link: str) -> bool:
+            return link.startswith(cdn_base_url.rstrip('/')) or link.startswith('/images/')
+
+        jobs: List[Tuple[Dict[str, str], str, str, str, str]] = []
+        for row in self.rows:
+            post_id = row.get('id', '').strip()
+            if not post_id or not re.fullmatch(r'[A-Za-z0-9_.-]+', post_id):
+                continue
+            fetched = self.fetched.get(post_id, {})
+            thumbnail = row.get('thumbnail_override', '').strip() or fetched.get('thumbnail_url', '')
+            if thumbnail.startswith('http') and not is_ours(row.get('thumbnail_cdn', '')):
+                jobs.append((row, 'thumbnail_cdn', f"{post_id}.webp", thumbnail, 'posts'))
+            avatar = fetched.get('avatar_url', '')
+            if avatar.startswith('http') and not is_ours(row.get('author_avatar_cdn', '')):
+                jobs.append((row, 'author_avatar_cdn', f"avatars/{post_id}.webp", avatar, 'avatars'))
+        if not jobs:
+            print("  ✅ All thumbnails and avatars already point at the CDN")
+            return
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(lambda job: mirror.mirror(job[2], job[3], job[4]), jobs))
+        changed = 0
+        for (row, column, rel_path, url, _kind), status in zip(jobs, results):
+            if status == 'failed':
+                print(f"  ❌ {rel_path} <- {url}")
+                continue
+            row[column] = f"{cdn_prefix}/{rel_path}"
+            changed += 1
+            if self.verbose:
+                print(f"  {status}: {rel_path} <- {url}")
+        mirror.save()
+        print(f"  ✅ {changed} link(s) now on {cdn_prefix}")
+        if changed:
+            self.write_csv()
+
+
+def check_fixtures(csv_path: Path = DEFAULT_CSV_PATH, expected_path: Path = EXPECTED_PATH,
+                   fixture_dir: Path = FIXTURE_DIR) -> int:
+    """Parse every post in expected.json from a local replay server and compare the fields.
+
+    Returns the number of cases that parsed differently. CSV rows without a case are
+    only reported, so a hand-added post doesn't need a fixture before it can ship.
+    """
+    from youtube_replay_server import FixtureStore, ReplayServer
+
+    cases = json.loads(expected_path.read_text(encoding='utf-8'))
+    server = ReplayServer(('127.0.0.1', 0), FixtureStore(social_root=fixture_dir))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    failures = 0
+    uncovered: List[Dict[str, str]] = []
+    try:
+        updater = SocialPostsUpdater(csv_path, base_url=server.url, max_retries=0)
+        # Fixtures need no pacing
+        updater.rate_limiter.initial_interval = updater.rate_limiter.min_interval = 0.0
+        for case in cases:
+            adapter = updater.adapter_for({'platform': case.get('platform', ''), 'url': case['url']})
+            got = adapter.fetch(case['url']) if adapter is not None else None
+            want = case['expected']
+            if got == want:
+                print(f"  ✅ {case['id']}")
+                continue
+            failures += 1
+            if got is None or want is None:
+                print(f"  ❌ {case['id']}: got {got}, expected {want}")
+                continue
+            print(f"  ❌ {case['id']}:")
+            for field in sorted(set(got) | set(want)):
+                if got.get(field) != want.get(field):
+                    print(f"       {field}: got {got.get(field)!r}, expected {want.get(field)!r}")
+
+        covered = {case['url'] for case in cases}
+        uncovered += [row for row in (updater.read_csv() if csv_path.exists() else [])
+                     if row.get('url', '').strip() not in covered]
+        for row in uncovered:
+            print(f"  ⚠️  {row.get('id')}: no fixture case for {row.get('url')}")
+    finally:
+        server.shutdown()
+        server.server_close()
+    print(f"Social fixtures: {len(cases) - failures}/{len(cases)} cases OK" +
+          (f", {len(uncovered)} CSV row(s) without a case" if uncovered else ""))
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Refresh like/comment counts in social-posts.csv (X, Bluesky, Instagram, YouTube)')
+    parser.add_argument('--csv-path', type=Path, default=DEFAULT_CSV_PATH,
+                        help='Path to CSV file (default: src/data/social-posts.csv)')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would be done without making changes')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Show detailed output')
+    parser.add_argument('--force', action='store_true', help="Also refresh rows whose fetch_status is 'ok'")
+    parser.add_argument('--older-than', metavar='AGE',
+                        help="Refresh 'ok' rows whose fetch_date is older than AGE (e.g. 7d, 12h)")
+    parser.add_argument('--include-manual', action='store_true',
+                        help="Also refresh counts of 'manual' rows (their text is never overwritten)")
+    parser.add_argument('--platform', action='append', choices=[cls.name for cls in ADAPTERS],
+                        help='Only rows of this platform (repeatable)')
+    parser.add_argument('--workers', type=int, default=4, metavar='N', help='Posts fetched concurrently (default: 4)')
+    parser.add_argument('--max-retries', type=int, default=4, metavar='N',
+                        help='Retries per request after 429/5xx responses or connection errors (default: 4)')
+    parser.add_argument('--proxy', help='HTTP/HTTPS proxy URL (e.g., http://127.0.0.1:1087)')
+    parser.add_argument('--base-url', metavar='URL',
+                        help='Send all requests to a local youtube_replay_server.py instead of the live sites')
+    parser.add_argument('--mirror-images', action='store_true',
+                        help='Save thumbnails/avatars as WebP under src/images/social-posts and fill the *_cdn columns')
+    parser.add_argument('--images-dir', type=Path, metavar='DIR',
+                        help='With --mirror-images: where to save images (default: src/images/social-posts)')
+    parser.add_argument('--cdn-base-url', metavar='URL',
+                        help='With --mirror-images: origin of the CDN links (default: base_url in config.toml)')
+    parser.add_argument('--check-fixtures', action='store_true',
+                        help='Check that the adapters parse scripts/fixtures/social to expected.json, then exit')
+    args = parser.parse_args()
+
+    if args.check_fixtures:
+        sys.exit(1 if check_fixtures(args.csv_path) else 0)
+    if not args.csv_path.exists():
+        print(f"❌ CSV file not found: {args.csv_path}")
+        sys.exit(1)
+    older_than = None
+    if args.older_than:
+        try:
+            older_than = YouTubeCSVUpdater.parse_age(args.older_than)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+    if args.mirror_images and Image is None:
+        print("Error: --mirror-images needs Pillow: pip install Pillow")
+        sys.exit(1)
+    proxy = args.proxy or os.environ.get('http_proxy') or os.environ.get('https_proxy')
+
+    updater = SocialPostsUpdater(
+        args.csv_path, dry_run=args.dry_run, verbose=args.verbose, proxy=proxy, workers=args.workers,
+        max_retries=args.max_retries, base_url=args.base_url, force=args.force, older_than=older_than,
+        include_manual=args.include_manual, platforms=args.platform,
+    )
+    try:
+        updater.update_csv()
+    except KeyboardInterrupt:
+        sys.exit(130)
+    if args.mirror_images:
+        updater.mirror_images(images_dir=args.images_dir, cdn_base_url=args.cdn_base_url)
+
+
+if __name__ == '__main__':
+    main()
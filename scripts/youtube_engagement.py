@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+YouTube Engagement History
+
+Queries the views/likes/comments history that update_youtube_csv.py appends to
+src/data/youtube.engagement.db on every fetch.
+
+Usage:
+    python youtube_engagement.py growth [--metric views] [--days 7] [--limit 20] [--json]
+    python youtube_engagement.py history VIDEO_ID_OR_URL
+    python youtube_engagement.py import-csv
+    python youtube_engagement.py materialize [--dry-run]
+    python youtube_engagement.py stats
+"""
+
+import sys
+import json
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+from update_youtube_csv import EngagementStore, YouTubeCSVUpdater
+
+DEFAULT_CSV_PATH = Path(__file__).parent.parent / 'src' / 'data' / 'youtube.csv'
+
+
+def format_count(value) -> str:
+    return f"{value:,}" if isinstance(value, int) else '-'
+
+
+def cmd_growth(updater: YouTubeCSVUpdater, args):
+    movers = updater.history.growth(metric=args.metric, days=args.days)[:args.limit]
+    if args.json:
+        print(json.dumps(movers, indent=2))
+        return
+    if not movers:
+        print(f"No video has two or more {args.metric} samples yet.")
+        return
+    titles = {updater.table.key(row.get('youtube_url', '')): row.get('title', '') for row in updater.table.rows}
+    print(f"Top {len(movers)} by {args.metric} gained (latest sample vs. the one {args.days}+ day(s) before it):\n")
+    print(f"{'gain':>10} {'per day':>9} {'growth':>8} {'now':>10} {'days':>4}  video")
+    for item in movers:
+        pct = f"{item['growth_pct']:.1f}%" if item['growth_pct'] is not None else '-'
+        title = titles.get(item['video_id'], '')[:50]
+        print(f"{item['gain']:>+10,} {item['per_day']:>9,.1f} {pct:>8} {item['to']:>10,} {item['days']:>4}  "
+              f"{item['video_id']} {title}")
+
+
+def cmd_history(updater: YouTubeCSVUpdater, args):
+    video_id = updater.metadata_fetcher.extract_video_id(args.video) or args.video
+    samples = updater.history.history(video_id)
+    if not samples:
+        print(f"No samples for {video_id}")
+        return
+    print(f"{'fetched':<19} {'views':>10} {'likes':>8} {'comments':>9}")
+    for ts, views, likes, comments in samples:
+        when = datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S')
+        print(f"{when:<19} {format_count(views):>10} {format_count(likes):>8} {format_count(comments):>9}")
+
+
+def cmd_import_csv(updater: YouTubeCSVUpdater, args):
+    """Seed the store with the counts currently in the CSV, dated by fetch_date."""
+    samples = []
+    for row in updater.table.rows:
+        video_id = updater.metadata_fetcher.extract_video_id(row.get('youtube_url', ''))
+        try:
+            fetched = datetime.strptime(row.get('fetch_date', '').strip(), YouTubeCSVUpdater.FETCH_DATE_FORMAT)
+        except ValueError:
+            continue
+        samples.append((video_id, row, fetched.timestamp()))
+    stored = updater.history.record(samples)
+    print(f"Imported {stored} samples from {updater.csv_path} into {updater.history.path}")
+
+
+def cmd_materialize(updater: YouTubeCSVUpdater, args):
+    """Write each video's latest sample into the CSV's views/like_count/comment_count columns."""
+    latest = updater.history.latest()
+    changed = 0
+    for row in updater.table.rows:
+        sample = latest.get(updater.table.key(row.get('youtube_url', '')))
+        if not sample:
+            continue
+        ts, *counts = sample
+        fields = {field: str(count) for field, count in zip(EngagementStore.METRICS, counts) if count is not None}
+        if any(row.get(field, '') != value for field, value in fields.items()):
+            row.update(fields)
+            row['fetch_date'] = datetime.fromtimestamp(ts).strftime(YouTubeCSVUpdater.FETCH_DATE_FORMAT)
+            changed += 1
+    print(f"{changed} row(s) differ from the latest samples")
+    if changed:
+        updater.write_csv(updater.table.rows)
+
+
+def cmd_stats(updater: YouTubeCSVUpdater, args):
+    stats = updater.history.stats()
+    print(f"{updater.history.path}: {stats['videos']} videos, {stats['samples']} samples "
+          f"over {stats['days']} day(s), {stats['bytes'] / 1024:.1f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query the YouTube engagement history recorded by update_youtube_csv.py')
+    parser.add_argument('--csv-path', type=Path, default=DEFAULT_CSV_PATH,
+                        help='YouTube CSV; the history is the .engagement.db next to it (default: src/data/youtube.csv)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    growth = commands.add_parser('growth', help='Top movers by gain over the last N days')
+    growth.add_argument('--metric', choices=list(EngagementStore.METRICS), default='views')
+    growth.add_argument('--days', type=int, default=7)
+    growth.add_argument('--limit', type=int, default=20)
+    growth.add_argument('--json', action='store_true', help='Print results as JSON')
+
+    history = commands.add_parser('history', help='All samples of one video')
+    history.add_argument('video', metavar='VIDEO_ID_OR_URL')
+
+    commands.add_parser('import-csv', help="Seed the history with the CSV's current counts (dated by fetch_date)")
+    materialize = commands.add_parser('materialize', help="Update the CSV's count columns from the latest samples")
+    materialize.add_argument('--dry-run', action='store_true', help='Show what would change without writing')
+    commands.add_parser('stats', help='Size of the history store')
+
+    args = parser.parse_args()
+    if not args.csv_path.exists():
+        print(f"❌ CSV file not found: {args.csv_path}")
+        sys.exit(1)
+
+    updater = YouTubeCSVUpdater(args.csv_path, dry_run=getattr(args, 'dry_run', False), offline=True)
+    handlers = {
+        'growth': cmd_growth,
+        'history': cmd_history,
+        'import-csv': cmd_import_csv,
+        'materialize': cmd_materialize,
+        'stats': cmd_stats,
+    }
+    try:
+        handlers[args.command](updater, args)
+    finally:
+        updater.history.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+YouTube Replay Server
+
+A local stand-in for the YouTube endpoints used by update_youtube_csv.py. It serves
+recorded oEmbed, watch-page and Innertube responses from scripts/fixtures/youtube/,
+with configurable latency, jitter and error rate, so the updater can be exercised and
+benchmarked without touching the network.
+
+Fixtures are stored one directory per video id:
+    fixtures/youtube/<video_id>/oembed.json
+    fixtures/youtube/<video_id>/watch.html
+    fixtures/youtube/<video_id>/next.json
+and one directory per playlist/channel browse id, with pages in order:
+    fixtures/youtube/browse/<browse_id>/0.json, 1.json, ...
+    fixtures/youtube/browse/handles.json   ({"/@handle": "<channel browse id>"})
+A continuation token found in page N is answered with page N+1.
+
+Posts for update_social_posts_csv.py are served under /social/<platform>/ from
+    fixtures/social/<platform>/<key>.json (or .html)
+where <key> is the request's id/uris/handle parameter (last path segment of it), or
+else the last segment of the request path, i.e. the tweet id, Bluesky rkey or
+Instagram shortcode. `update_social_posts_csv.py --check-fixtures` replays them against
+fixtures/social/expected.json.
+
+Usage:
+    python youtube_replay_server.py serve [--port 8765] [--latency 80] [--jitter 40] [--error-rate 0.05] [--synthetic]
+    python youtube_replay_server.py record VIDEO_ID_OR_PLAYLIST_URL [...]
+    python youtube_replay_server.py record https://twitter.com/user/status/123 [...]
+
+Point the updater at it with:
+    python update_youtube_csv.py --base-url http://127.0.0.1:8765
+"""
+
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURE_DIR = Path(__file__).parent / 'fixtures' / 'youtube'
+SOCIAL_FIXTURE_DIR = Path(__file__).parent / 'fixtures' / 'social'
+
+# Endpoint name (as used by the updater's rate limiter) -> fixture file and content type
+FIXTURE_FILES = {
+    'oembed': ('oembed.json', 'application/json'),
+    'watch': ('watch.html', 'text/html; charset=utf-8'),
+    'innertube': ('next.json', 'application/json'),
+}
+
+VIDEO_ID_RE = re.compile(r'^[A-Za-z0-9_-]{11}$')
+SOCIAL_KEY_RE = re.compile(r'^[A-Za-z0-9_.:-]+$')
+
+
+def social_fixture_key(url: str) -> str:
+    """Fixture name for a social platform request (see the module docstring)."""
+    parsed = urlparse(url)
+    query = parse_qs(parsed.query)
+    for name in ('id', 'uris', 'handle'):
+        if query.get(name):
+            return query[name][0].rstrip('/').rsplit('/', 1)[-1]
+    return parsed.path.rstrip('/').rsplit('/', 1)[-1]
+
+
+class FixtureStore:
+    """Recorded responses, loaded into memory on first use.
+
+    With `synthetic` enabled, unknown video ids are answered from a template fixture
+    with the template's id substituted, so benchmarks can use any number of ids.
+    """
+
+    def __init__(self, root: Path = FIXTURE_DIR, synthetic: bool = False, template: Optional[str] = None,
+                 social_root: Path = SOCIAL_FIXTURE_DIR):
+        self.root = root
+        self.social_root = social_root
+        self.synthetic = synthetic
+        self.video_ids = sorted(
+            p.name for p in root.iterdir() if p.is_dir() and VIDEO_ID_RE.match(p.name)
+        ) if root.is_dir() else []
+        self.browse_root = root / 'browse'
+        self._continuations: Optional[Dict[str, Tuple[str, int]]] = None
+        self.template = template or (self.video_ids[0] if self.video_ids else None)
+        if synthetic and self.template not in self.video_ids:
+            raise ValueError(f"Template fixture not found: {root / str(self.template)}")
+        self._cache: Dict[Tuple[str, str], Optional[bytes]] = {}
+        self._lock = threading.Lock()
+
+    def _read(self, video_id: str, endpoint: str) -> Optional[bytes]:
+        key = (video_id, endpoint)
+        with self._lock:
+            if key not in self._cache:
+                path = self.root / video_id / FIXTURE_FILES[endpoint][0]
+                self._cache[key] = path.read_bytes() if path.is_file() else None
+            return self._cache[key]
+
+    def get(self, video_id: str, endpoint: str) -> Optional[bytes]:
+        """Body for `endpoint` of `video_id`, or None when there is no recording."""
+        if not VIDEO_ID_RE.match(video_id or ''):
+            return None
+        if video_id in self.video_ids:
+            return self._read(video_id, endpoint)
+        if self.synthetic:
+            body = self._read(self.template, endpoint)
+            if body is not None:
+                return body.replace(self.template.encode(), video_id.encode())
+        return None
+
+    def _browse_page_path(self, browse_id: str, page: int) -> Path:
+        return self.browse_root / browse_id / f'{page}.json'
+
+    def _index_continuations(self) -> Dict[str, Tuple[str, int]]:
+        """Map each continuation token in the recorded pages to the page that follows it."""
+        with self._lock:
+            if self._continuations is None:
+                index = {}
+                if self.browse_root.is_dir():
+                    for path in self.browse_root.glob('*/*.json'):
+                        if not path.stem.isdigit():
+                            continue
+                        text = path.read_text(encoding='utf-8')
+                        for token in re.findall(r'"continuationCommand":\s*\{[^{}]*?"token":\s*"([^"]+)"', text):
+                            index[token] = (path.parent.name, int(path.stem) + 1)
+                self._continuations = index
+            return self._continuations
+
+    def browse(self, browse_id: Optional[str] = None, continuation: Optional[str] = None) -> Optional[bytes]:
+        """First page of `browse_id`, or the page following `continuation`."""
+        page = 0
+        if continuation:
+            browse_id, page = self._index_continuations().get(continuation, (None, 0))
+        if not browse_id or '/' in browse_id or browse_id.startswith('.'):
+            return None
+        path = self._browse_page_path(browse_id, page)
+        return path.read_bytes() if path.is_file() else None
+
+    def resolve(self, url: str) -> Optional[bytes]:
+        """navigation/resolve_url answer for a channel URL listed in browse/handles.json."""
+        handles_path = self.browse_root / 'handles.json'
+        if not handles_path.is_file():
+            return None
+        handles = json.loads(handles_path.read_text(encoding='utf-8'))
+        path = urlparse(url).path.rstrip('/')
+        # /@handle/videos and /@handle resolve to the same channel
+        path = '/'.join(path.split('/')[:2] if path.startswith('/@') else path.split('/')[:3])
+        browse_id = handles.get(path)
+        if not browse_id:
+            return None
+        return json.dumps({'endpoint': {'browseEndpoint': {'browseId': browse_id, 'canonicalBaseUrl': path}}}).encode()
+
+
+    def social(self, platform: str, key: str) -> Optional[Tuple[bytes, str]]:
+        """(body, content type) recorded for a social post request, or None."""
+        if not SOCIAL_KEY_RE.match(platform) or not SOCIAL_KEY_RE.match(key) or key.startswith('.'):
+            return None
+        for suffix, content_type in (('.json', 'application/json'), ('.html', 'text/html; charset=utf-8')):
+            path = self.social_root / platform / (key + suffix)
+            if path.is_file():
+                return path.read_bytes(), content_type
+        return None
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """HTTP server answering oEmbed, watch and Innertube next/browse requests from a FixtureStore."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], store: FixtureStore, latency: float = 0.0,
+                 jitter: float = 0.0, error_rate: float = 0.0, verbose: bool = False):
+        super().__init__(address, ReplayHandler)
+        self.store = store
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.verbose = verbose
+        self.stats_lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, endpoint: str, status: int, size: int):
+        with self.stats_lock:
+            stats = self.stats.setdefault(endpoint, {'requests': 0, 'bytes': 0, 'errors': 0, 'not_found': 0})
+            stats['requests'] += 1
+            stats['bytes'] += size
+            if status in (429, 503):
+                stats['errors'] += 1
+            elif status == 404:
+                stats['not_found'] += 1
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server: ReplayServer
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, endpoint: str, status: int, body: bytes, content_type: str = 'text/plain; charset=utf-8',
+              headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.record(endpoint, status, len(body))
+
+    def _respond(self, endpoint: str, video_id: str):
+        self._respond_with(endpoint, lambda: self.server.store.get(video_id, endpoint), FIXTURE_FILES[endpoint][1])
+
+    def _respond_with(self, endpoint: str, load, content_type: str):
+        server = self.server
+        delay = server.latency + random.uniform(0, server.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        if server.error_rate and random.random() < server.error_rate:
+            if random.random() < 0.5:
+                self._send(endpoint, 429, b'Too Many Requests', headers={'Retry-After': '1'})
+            else:
+                self._send(endpoint, 503, b'Service Unavailable')
+            return
+        body = load()
+        if body is None:
+            self._send(endpoint, 404, b'Not Found')
+            return
+        self._send(endpoint, 200, body, content_type)
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        if parsed.path == '/oembed':
+            target = parse_qs(urlparse(query.get('url', [''])[0]).query)
+            self._respond('oembed', target.get('v', [''])[0])
+        elif parsed.path == '/watch':
+            self._respond('watch', query.get('v', [''])[0])
+        elif parsed.path.startswith('/social/'):
+            platform = parsed.path.split('/')[2]
+            found = self.server.store.social(platform, social_fixture_key(self.path))
+            self._respond_with(platform, lambda: found[0] if found else None,
+                               found[1] if found else 'application/json')
+        elif parsed.path == '/__stats':
+            with self.server.stats_lock:
+                body = json.dumps(self.server.stats).encode()
+            self._send('stats', 200, body, 'application/json')
+        else:
+            self._send('other', 404, b'Not Found')
+
+    def do_POST(self):
+        parsed = urlparse(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        try:
+            payload = json.loads(raw or b'{}')
+        except ValueError:
+            payload = {}
+        if parsed.path == '/youtubei/v1/next':
+            self._respond('innertube', payload.get('videoId', ''))
+        elif parsed.path == '/youtubei/v1/browse':
+            self._respond_with('browse', lambda: self.server.store.browse(
+                payload.get('browseId'), payload.get('continuation')), 'application/json')
+        elif parsed.path == '/youtubei/v1/navigation/resolve_url':
+            self._respond_with('browse', lambda: self.server.store.resolve(payload.get('url', '')), 'application/json')
+        else:
+            self._send('other', 404, b'Not Found')
+
+
+def record_fixtures(targets, root: Path = FIXTURE_DIR, proxy: str = None, max_videos: Optional[int] = None,
+                    social_root: Path = SOCIAL_FIXTURE_DIR):
+    """Fetch live responses the same way the updater does and store them as fixtures.
+
+    `targets` are video ids/URLs, playlist/channel URLs whose browse pages are recorded,
+    or X/Bluesky/Instagram post URLs (recorded through update_social_posts_csv's adapters).
+    """
+    from update_youtube_csv import AdaptiveRateLimiter, HTTPClient, YouTubeMetadataFetcher
+    from update_social_posts_csv import ADAPTERS, YouTubeAdapter
+
+    class RecordingHTTP(HTTPClient):
+        def request(self, endpoint, method, url, direct=False, **kwargs):
+            response = super().request(endpoint, method, url, direct=direct, **kwargs)
+            if response.status_code == 200:
+                suffix = '.json' if 'json' in response.headers.get('Content-Type', '') else '.html'
+                path = social_root / endpoint / (social_fixture_key(url) + suffix)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(response.content)
+                print(f"  💾 {path} ({len(response.content)} bytes)")
+            return response
+
+    social_http, social_limiter = RecordingHTTP(proxy=proxy), AdaptiveRateLimiter()
+    social_adapters = [cls(social_http, social_limiter) for cls in ADAPTERS if cls is not YouTubeAdapter]
+
+    class RecordingFetcher(YouTubeMetadataFetcher):
+        current = None
+        browse_id = None
+        page = 0
+
+        def _innertube_post(self, endpoint, path, payload):
+            response = super()._innertube_post(endpoint, path, payload)
+            if response.status_code != 200:
+                return response
+            if path == 'browse':
+                if 'browseId' in payload:
+                    self.browse_id, self.page = payload['browseId'], 0
+                else:
+                    self.page += 1
+                target = root / 'browse' / self.browse_id / f'{self.page}.json'
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(response.content)
+                print(f"  💾 {target} ({len(response.content)} bytes)")
+            elif path == 'navigation/resolve_url':
+                browse_id = ((response.json().get('endpoint') or {}).get('browseEndpoint') or {}).get('browseId')
+                handles_path = root / 'browse' / 'handles.json'
+                handles = json.loads(handles_path.read_text(encoding='utf-8')) if handles_path.is_file() else {}
+                if browse_id:
+                    handles[urlparse(payload['url']).path.rstrip('/')] = browse_id
+                    handles_path.parent.mkdir(parents=True, exist_ok=True)
+                    handles_path.write_text(json.dumps(handles, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+            return response
+
+        def _save(self, endpoint, response):
+            if endpoint in FIXTURE_FILES and response.status_code == 200 and self.current:
+                path = root / self.current / FIXTURE_FILES[endpoint][0]
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(response.content)
+                print(f"  💾 {path} ({len(response.content)} bytes)")
+            return response
+
+        def _get(self, endpoint, url, **kwargs):
+            return self._save(endpoint, super()._get(endpoint, url, **kwargs))
+
+        def _post(self, endpoint, url, **kwargs):
+            return self._save(endpoint, super()._post(endpoint, url, **kwargs))
+
+    fetcher = RecordingFetcher(proxy=proxy)
+    for target in targets:
+        adapter = next((a for a in social_adapters if a.matches(target)), None)
+        if adapter is not None:
+            print(f"💬 Recording {adapter.name} post {adapter.post_id(target)}")
+            if adapter.fetch(target) is None:
+                print(f"  ⚠️  No data for {target}; fixture may be incomplete")
+            continue
+        if fetcher.is_collection_url(target):
+            print(f"📃 Recording browse pages of {target}")
+            count = sum(1 for _ in fetcher.iter_collection_video_ids(target, max_videos=max_videos))
+            print(f"  {count} video ids listed")
+            continue
+        video_id = fetcher.extract_video_id(target) or target
+        print(f"🎬 Recording {video_id}")
+        fetcher.current = video_id
+        metadata = fetcher.fetch_video_metadata(video_id)
+        if not metadata.get('title'):
+            print(f"  ⚠️  No metadata for {video_id}; fixture may be incomplete")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Serve recorded YouTube responses for update_youtube_csv.py, or record new ones.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--fixtures', type=Path, default=FIXTURE_DIR,
+                        help=f'Fixture directory (default: {FIXTURE_DIR})')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve', help='Serve fixtures over HTTP')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765, help='Port to listen on, 0 picks a free one (default: 8765)')
+    serve.add_argument('--latency', type=float, default=0.0, metavar='MS', help='Fixed delay per response in milliseconds')
+    serve.add_argument('--jitter', type=float, default=0.0, metavar='MS', help='Random extra delay up to this many milliseconds')
+    serve.add_argument('--error-rate', type=float, default=0.0, metavar='P',
+                       help='Probability of answering 429/503 instead of the fixture (0-1)')
+    serve.add_argument('--synthetic', action='store_true',
+                       help='Answer unknown video ids from a template fixture (for benchmarks)')
+    serve.add_argument('--template', metavar='VIDEO_ID', help='Fixture used for --synthetic (default: first fixture)')
+    serve.add_argument('--verbose', '-v', action='store_true', help='Log every request')
+
+    record = commands.add_parser('record', help='Record live responses as fixtures')
+    record.add_argument('targets', nargs='+', metavar='VIDEO_ID_OR_URL',
+                        help='Video ids/URLs, playlist/channel URLs to record browse pages for, or social post URLs')
+    record.add_argument('--proxy', help='Proxy URL for the live requests')
+    record.add_argument('--max-videos', type=int, metavar='N', help='Stop paging a playlist/channel after N videos')
+
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        record_fixtures(args.targets, root=args.fixtures, proxy=args.proxy, max_videos=args.max_videos)
+        return
+
+    try:
+        store = FixtureStore(args.fixtures, synthetic=args.synthetic, template=args.template)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    server = ReplayServer((args.host, args.port), store, latency=args.latency / 1000,
+                          jitter=args.jitter / 1000, error_rate=args.error_rate, verbose=args.verbose)
+    mode = ' (synthetic ids enabled)' if args.synthetic else ''
+    print(f"Serving {len(store.video_ids)} recorded videos{mode} on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
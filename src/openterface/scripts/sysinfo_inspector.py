@@ -14,6 +14,13 @@ Designed to run without root; will gracefully fall back when tools/files are mis
 Usage:
     python3 scripts/sysinfo_inspector.py [--json] [--output FILE]
     python3 scripts/sysinfo_inspector.py --usb --modules
+    python3 scripts/sysinfo_inspector.py --fast --json     # sysfs/procfs only, nothing forked
+    python3 scripts/sysinfo_inspector.py --bench [report|usb-tree|sysfs]
+    python3 scripts/sysinfo_inspector.py --watch [--watch-record FILE]  # live USB hotplug deltas
+    python3 scripts/sysinfo_inspector.py --watch-replay FILE
+    python3 scripts/sysinfo_inspector.py --serial-bench [N] [--serial-tty TTY]  # link latency/throughput as JSON
+    OPF_SYSFS_ROOT=... OPF_DEV_DIR=... python3 scripts/sysinfo_inspector.py --serial-test  # fake tree, see
+                                        # scripts/openterface_serial_emulator.py in Openterface_assets
 
 Dependencies (optional, improves output):
  - lsusb (usb tree alternative)
@@ -27,17 +34,41 @@ import os
 import platform
 import subprocess
 import shutil
+import socket
 import sys
 import re
-from typing import Dict, List, Optional, Tuple
-
-
-def run_cmd(cmd: List[str]) -> Tuple[int, str, str]:
+import select
+import statistics
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from collections import deque
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+# seconds an external tool may run before it is killed (lspci/lsusb can stall on
+# flaky buses), and seconds build_report() waits for a collector before it records
+# a placeholder instead
+CMD_TIMEOUT = 10.0
+COLLECTOR_TIMEOUT = 10.0
+
+# where sysfs and the tty device nodes live; overridable so a fake tree (e.g. from
+# scripts/openterface_serial_emulator.py) can stand in for real hardware
+SYSFS_ROOT = os.environ.get("OPF_SYSFS_ROOT", "/sys")
+DEV_DIR = os.environ.get("OPF_DEV_DIR", "/dev")
+USB_SYSFS_DIR = os.path.join(SYSFS_ROOT, "bus", "usb", "devices")
+PCI_SYSFS_DIR = os.path.join(SYSFS_ROOT, "bus", "pci", "devices")
+
+
+def run_cmd(cmd: List[str], timeout: Optional[float] = None) -> Tuple[int, str, str]:
+    timeout = CMD_TIMEOUT if timeout is None else timeout
     try:
-        p = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        p = subprocess.run(cmd, capture_output=True, text=True, check=False, timeout=timeout)
         return p.returncode, p.stdout.strip(), p.stderr.strip()
     except FileNotFoundError:
         return 127, "", f"{cmd[0]}: not found"
+    except subprocess.TimeoutExpired:
+        return 124, "", f"{cmd[0]}: timed out after {timeout:g}s"
 
 
 def get_distro_info() -> Dict[str, str]:
@@ -71,17 +102,24 @@ def get_distro_info() -> Dict[str, str]:
     }
 
 
-def get_kernel_info() -> Dict[str, str]:
+def get_kernel_info(fast: bool = False) -> Dict[str, str]:
     uname = platform.uname()
-    bits = platform.architecture()[0] or ""
     machine = uname.machine or platform.machine() or ""
+    # platform.architecture() runs `file` on the interpreter and uname.processor runs
+    # `uname -p`; the fast path uses the pointer size and the machine name instead
+    if fast:
+        bits = f"{struct.calcsize('P') * 8}bit"
+        processor = machine
+    else:
+        bits = platform.architecture()[0] or ""
+        processor = uname.processor
     kernel = {
         "system": uname.system,
         "node": uname.node,
         "release": uname.release,
         "version": uname.version,
         "machine": machine,
-        "processor": uname.processor,
+        "processor": processor,
         "architecture": f"{machine} ({bits})",
         "bits": bits,
     }
@@ -189,6 +227,29 @@ def read_sysfs_attr(path: str, attr: str) -> Optional[str]:
         return None
 
 
+def parse_uevent(text: str) -> Dict[str, str]:
+    return dict(line.split("=", 1) for line in text.splitlines() if "=" in line)
+
+
+def read_uevent(path: str) -> Dict[str, str]:
+    """Return the KEY=VALUE lines of <path>/uevent as a dict (empty when unreadable)."""
+    return parse_uevent(read_sysfs_attr(path, "uevent") or "")
+
+
+def read_attr_at(dir_fd: int, attr: str) -> Optional[str]:
+    """read_sysfs_attr() relative to an open directory fd: openat + one read, no path walk."""
+    try:
+        fd = os.open(attr, os.O_RDONLY, dir_fd=dir_fd)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, 4096).decode("utf-8", "replace").strip()
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
 def _parse_lsusb(output: str) -> Dict[Tuple[int, int], Dict[str, str]]:
     """Parse plain `lsusb` output and return mapping (bus,dev) -> {idVendor,idProduct,desc}.
 
@@ -213,54 +274,106 @@ def _parse_lsusb(output: str) -> Dict[Tuple[int, int], Dict[str, str]]:
     return out
 
 
-def collect_usb_from_sysfs(lsusb_map: Optional[Dict[Tuple[int, int], Dict[str, str]]] = None) -> List[Dict[str, object]]:
-    base = "/sys/bus/usb/devices"
+def usb_parent_name(name: str) -> Optional[str]:
+    """Return the sysfs name of a USB node's parent, or None for a root hub.
+
+    Names are usbB (root hub), B-0:C.I (root hub interface), B-P[.P...] (device on a
+    port chain) and B-P[.P...]:C.I (interface): an interface belongs to its device, a
+    device to the hub one port up, and a device on a root port to usbB.
+    """
+    device, colon, _ = name.partition(":")
+    bus, dash, ports = device.partition("-")
+    if not dash:
+        return None
+    if colon:
+        return f"usb{bus}" if ports == "0" else device
+    hub, dot, _ = ports.rpartition(".")
+    return f"{bus}-{hub}" if dot else f"usb{bus}"
+
+
+def _usb_sort_key(name: str) -> List[object]:
+    # natural order: 1-2 < 1-10, usb2 < usb10
+    return [int(p) if p.isdigit() else p for p in re.split(r"(\d+)", name)]
+
+
+def build_usb_tree(devices: Dict[str, Dict[str, object]]) -> List[Dict[str, object]]:
+    """Link sysfs USB nodes into a tree by name; returns the roots in natural order.
+
+    Each parent is found with a dict lookup on usb_parent_name(), walking further up
+    when an intermediate node is missing (e.g. unreadable), so the build is linear
+    apart from the sort that keeps children ordered.
+    """
+    nodes = {name: {**dev, "children": []} for name, dev in devices.items()}
+    roots: Set[str] = set()
+    for name in sorted(nodes, key=_usb_sort_key):
+        parent = usb_parent_name(name)
+        while parent is not None and parent not in nodes:
+            parent = usb_parent_name(parent)
+        if parent is None:
+            roots.add(name)
+        else:
+            nodes[parent]["children"].append(nodes[name])
+    return [nodes[name] for name in sorted(roots, key=_usb_sort_key)]
+
+
+# sysfs attributes of a USB device that its uevent does not carry (interfaces have none)
+USB_DEVICE_ATTRS = ("manufacturer", "product", "serial", "devpath")
+
+
+def usb_fields_from_uevent(props: Dict[str, str]) -> Dict[str, str]:
+    """Map USB uevent properties to the sysfs attribute names used in the report.
+
+    PRODUCT=vvvv/pppp/bcd gives idVendor/idProduct (the kernel prints them unpadded),
+    BUSNUM/DEVNUM give busnum/devnum and DRIVER the bound driver.
+    """
+    fields: Dict[str, str] = {}
+    product = props.get("PRODUCT", "").split("/")
+    if len(product) >= 2:
+        fields["idVendor"] = product[0].lower().zfill(4)
+        fields["idProduct"] = product[1].lower().zfill(4)
+    for key, attr in (("BUSNUM", "busnum"), ("DEVNUM", "devnum")):
+        if props.get(key, "").isdigit():
+            fields[attr] = str(int(props[key]))
+    if props.get("DRIVER"):
+        fields["driver"] = props["DRIVER"]
+    return fields
+
+
+def read_usb_sysfs_node(base: str, name: str) -> Optional[Dict[str, object]]:
+    """Read one entry of /sys/bus/usb/devices, or None when it is not a readable directory.
+
+    uevent is read once and supplies ids, bus/dev numbers and driver; the few remaining
+    attributes of a device are opened relative to a directory fd, so the sysfs path is
+    resolved once per node instead of once per attribute.
+    """
+    path = os.path.join(base, name)
+    try:
+        dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return None
+    dev: Dict[str, object] = {"name": name, "path": path}
+    try:
+        props = parse_uevent(read_attr_at(dir_fd, "uevent") or "")
+        dev.update(usb_fields_from_uevent(props))
+        if props.get("DEVTYPE") != "usb_interface":
+            for attr in USB_DEVICE_ATTRS:
+                v = read_attr_at(dir_fd, attr)
+                if v:
+                    dev[attr] = v
+    finally:
+        os.close(dir_fd)
+    return dev
+
+
+def collect_usb_from_sysfs(lsusb_map: Optional[Dict[Tuple[int, int], Dict[str, str]]] = None,
+                           base: str = USB_SYSFS_DIR) -> List[Dict[str, object]]:
     if not os.path.isdir(base):
         return []
     devices: Dict[str, Dict[str, object]] = {}
     for name in os.listdir(base):
-        # skip entries like usb1, usb2 (they are hubs' interface files) but include them
-        path = os.path.join(base, name)
-        if not os.path.isdir(path):
+        dev = read_usb_sysfs_node(base, name)
+        if dev is None:
             continue
-        # only consider names that look like device nodes (contain digits and '-')
-        # but include others defensively
-        dev: Dict[str, object] = {"name": name, "path": path}
-        for attr in (
-            "idVendor",
-            "idProduct",
-            "manufacturer",
-            "product",
-            "serial",
-            "busnum",
-            "devnum",
-            "devpath",
-        ):
-            v = read_sysfs_attr(path, attr)
-            if v:
-                dev[attr] = v
-        # try reading PRODUCT from uevent (format often: PRODUCT=vvvv/pppp/..)
-        u = read_sysfs_attr(path, "uevent")
-        if u and "PRODUCT=" in u:
-            try:
-                prod = [l for l in u.splitlines() if l.startswith("PRODUCT=")][0].split("=", 1)[1]
-                parts = prod.split("/")
-                if len(parts) >= 2:
-                    dev.setdefault("idVendor", parts[0].lower())
-                    dev.setdefault("idProduct", parts[1].lower())
-            except Exception:
-                pass
-
-        # driver
-        drv = None
-        drv_link = os.path.join(path, "driver")
-        if os.path.islink(drv_link):
-            try:
-                drv = os.path.basename(os.readlink(drv_link))
-            except Exception:
-                drv = None
-        if drv:
-            dev["driver"] = drv
 
         # enrich from lsusb mapping when busnum/devnum provided
         if lsusb_map and "busnum" in dev and "devnum" in dev:
@@ -277,26 +390,7 @@ def collect_usb_from_sysfs(lsusb_map: Optional[Dict[Tuple[int, int], Dict[str, s
 
         devices[name] = dev
 
-    # build parent-child by prefix heuristic: parent is the longest other name which is a prefix
-    tree_nodes: Dict[str, Dict[str, object]] = {}
-    for name, dev in devices.items():
-        tree_nodes[name] = {**dev, "children": []}
-    for name in sorted(tree_nodes.keys(), key=lambda s: len(s)):
-        # find parent
-        parent = None
-        for cand in tree_nodes.keys():
-            if cand == name:
-                continue
-            if name.startswith(cand + "-") or name.startswith(cand + "."):
-                if parent is None or len(cand) > len(parent):
-                    parent = cand
-        if parent:
-            tree_nodes[parent]["children"].append(tree_nodes[name])
-    # roots: those not a child of any other
-    roots = [n for n in tree_nodes.values() if not any(n is c for p in tree_nodes.values() for c in p.get("children", []))]
-    # fallback: sort roots by name
-    roots = sorted(roots, key=lambda r: r.get("name", ""))
-    return roots
+    return build_usb_tree(devices)
 
 
 def parse_lsusb_tree(text: str, lsusb_map: Optional[Dict[Tuple[int, int], Dict[str, str]]] = None) -> List[Dict[str, object]]:
@@ -392,6 +486,181 @@ def get_usb_tree(force_sysfs: bool = False) -> Dict[str, object]:
     return {"source": src, "tree": roots}
 
 
+# ---------------- Fast path: sysfs/procfs only -----------------
+
+# Trimmed copy of http://www.linux-usb.org/usb.ids (same format): root hubs, common hubs,
+# USB-serial bridges and the chips used in Openterface devices. Used by --fast to name
+# devices without forking lsusb; extend it by pasting lines from the full file.
+USB_IDS_SUBSET = """
+0403  Future Technology Devices International, Ltd
+	6001  FT232 Serial (UART) IC
+	6010  FT2232C/D/H Dual UART/FIFO IC
+	6015  Bridge(I2C/SPI/UART/FIFO)
+0424  Microchip Technology, Inc. (formerly SMSC)
+	2514  USB 2.0 Hub
+046d  Logitech, Inc.
+	082d  HD Pro Webcam C920
+	c52b  Unifying Receiver
+	c534  Unifying Receiver
+05e3  Genesys Logic, Inc.
+	0608  Hub
+	0610  Hub
+	0626  Hub
+067b  Prolific Technology, Inc.
+	2303  PL2303 Serial Port / Mobile Action MA-8910P
+0bda  Realtek Semiconductor Corp.
+	5411  RTS5411 Hub
+	8153  RTL8153 Gigabit Ethernet Adapter
+10c4  Silicon Labs
+	ea60  CP210x UART Bridge
+1a86  QinHeng Electronics
+	5523  CH341 in serial mode, usb to serial port converter
+	7523  CH340 serial converter
+	fe0c  Openterface serial (CH32V208)
+1d6b  Linux Foundation
+	0001  1.1 root hub
+	0002  2.0 root hub
+	0003  3.0 root hub
+2109  VIA Labs, Inc.
+	0813  VL813 Hub
+	2813  VL813 Hub
+534d  MacroSilicon
+	2109  MS2109 HDMI video capture
+8087  Intel Corp.
+	0024  Integrated Rate Matching Hub
+	0026  AX201 Bluetooth
+	0029  AX200 Bluetooth
+	0032  AX210 Bluetooth
+	0a2b  Bluetooth wireless interface
+"""
+
+# PCI class/subclass names as printed by lspci, for the common classes
+PCI_CLASSES = {
+    "0000": "Non-VGA unclassified device",
+    "0101": "IDE interface",
+    "0104": "RAID bus controller",
+    "0106": "SATA controller",
+    "0107": "Serial Attached SCSI controller",
+    "0108": "Non-Volatile memory controller",
+    "0180": "Mass storage controller",
+    "0200": "Ethernet controller",
+    "0280": "Network controller",
+    "0300": "VGA compatible controller",
+    "0302": "3D controller",
+    "0380": "Display controller",
+    "0401": "Multimedia audio controller",
+    "0403": "Audio device",
+    "0480": "Multimedia controller",
+    "0500": "RAM memory",
+    "0580": "Memory controller",
+    "0600": "Host bridge",
+    "0601": "ISA bridge",
+    "0604": "PCI bridge",
+    "0680": "Bridge",
+    "0700": "Serial controller",
+    "0780": "Communication controller",
+    "0805": "SD Host controller",
+    "0880": "System peripheral",
+    "0c03": "USB controller",
+    "0c05": "SMBus",
+    "0c80": "Serial bus controller",
+    "1180": "Signal processing controller",
+    "ff00": "Unassigned class",
+}
+
+_usb_ids: Optional[Dict[str, Tuple[str, Dict[str, str]]]] = None
+
+
+def usb_ids_desc(vid: Optional[object], pid: Optional[object]) -> Optional[str]:
+    """Return "<vendor> <product>" from USB_IDS_SUBSET, like the description lsusb prints."""
+    global _usb_ids
+    if _usb_ids is None:
+        _usb_ids = {}
+        vendor: Optional[str] = None
+        for line in USB_IDS_SUBSET.splitlines():
+            if not line.strip() or line.startswith("#"):
+                continue
+            key, name = line.strip().split(None, 1)
+            if line.startswith("\t"):
+                if vendor:
+                    _usb_ids[vendor][1][key.lower()] = name
+            else:
+                vendor = key.lower()
+                _usb_ids[vendor] = (name, {})
+    entry = _usb_ids.get(str(vid or "").lower())
+    if not entry:
+        return None
+    product = entry[1].get(str(pid or "").lower())
+    return f"{entry[0]} {product}" if product else entry[0]
+
+
+def parse_proc_modules(text: str) -> List[Dict[str, object]]:
+    """Parse /proc/modules into the same entries as parse_lsmod_output()."""
+    entries: List[Dict[str, object]] = []
+    for line in text.splitlines():
+        parts = line.split()
+        if len(parts) < 4:
+            continue
+        # lsmod prints the refcount followed by the holders without the trailing comma
+        used_by = [parts[2]]
+        holders = parts[3].rstrip(",")
+        if holders and holders != "-":
+            used_by.append(holders)
+        entries.append({"module": parts[0], "size": parts[1], "used_by": used_by})
+    return entries
+
+
+def get_loaded_modules_fast() -> Dict[str, object]:
+    try:
+        with open("/proc/modules", "r", encoding="utf-8") as f:
+            return {"source": "/proc/modules", "modules": parse_proc_modules(f.read())}
+    except Exception:
+        return {"source": "none", "modules": []}
+
+
+def get_pci_info_fast() -> Dict[str, object]:
+    """Build `lspci -k` style entries from /sys/bus/pci/devices (numeric IDs, no pci.ids names)."""
+    base = PCI_SYSFS_DIR
+    if not os.path.isdir(base):
+        return {"available": False, "reason": f"{base} not found"}
+    devices: List[Dict[str, object]] = []
+    for slot in sorted(os.listdir(base)):
+        path = os.path.join(base, slot)
+        # uevent carries class, ids and driver in one read
+        props = read_uevent(path)
+        cls = props.get("PCI_CLASS", "").lower().zfill(6)
+        vid, _, did = props.get("PCI_ID", "").lower().partition(":")
+        line = f"{slot[5:] if slot.startswith('0000:') else slot} {PCI_CLASSES.get(cls[:4]) or 'Class ' + cls[:4]}: Device {vid}:{did}"
+        rev = (read_sysfs_attr(path, "revision") or "").lower().replace("0x", "")
+        if rev and rev != "00":
+            line += f" (rev {rev})"
+        entry: Dict[str, object] = {"device": line, "drivers": []}
+        if props.get("PCI_SUBSYS_ID", "0000:0000") != "0000:0000":
+            entry["extra"] = [f"Subsystem: Device {props['PCI_SUBSYS_ID'].lower()}"]
+        if props.get("DRIVER"):
+            entry["kernel_driver_in_use"] = props["DRIVER"]
+            module_link = os.path.join(path, "driver", "module")
+            if os.path.islink(module_link):
+                entry["kernel_modules"] = [os.path.basename(os.readlink(module_link))]
+        devices.append(entry)
+    return {"available": True, "devices": devices}
+
+
+def get_usb_tree_fast() -> Dict[str, object]:
+    """USB tree from sysfs only, with lsusb-style descriptions from USB_IDS_SUBSET."""
+    roots = collect_usb_from_sysfs()
+
+    def _describe(nodes: List[Dict[str, object]]) -> None:
+        for n in nodes:
+            desc = usb_ids_desc(n.get("idVendor"), n.get("idProduct"))
+            if desc:
+                n.setdefault("lsusb_desc", desc)
+            _describe(n.get("children") or [])
+
+    _describe(roots)
+    return {"source": "sysfs (+usb.ids)", "tree": roots}
+
+
 def format_usb_node(n: Dict[str, object]) -> str:
     # Support both sysfs-style nodes (have 'name') and lsusb -t nodes (have 'path')
     name = n.get("name") or n.get("path") or "<unknown>"
@@ -418,13 +687,217 @@ def format_usb_node(n: Dict[str, object]) -> str:
     return "  ".join(parts)
 
 
+# ---------------- USB hotplug watch -----------------
+
+NETLINK_KOBJECT_UEVENT = 15
+UEVENT_HEADER_RE = re.compile(r"^(KERNEL|UDEV)\[([\d.]+)\]\s+(\S+)\s+(\S+)")
+
+
+def parse_netlink_uevent(data: bytes) -> Optional[Dict[str, str]]:
+    """Parse one kernel uevent datagram ("action@devpath\0KEY=VALUE\0..."); None for udev's own."""
+    if data.startswith(b"libudev"):
+        return None
+    fields = data.decode("utf-8", "replace").split("\0")
+    if "@" not in fields[0]:
+        return None
+    return parse_uevent("\n".join(fields[1:]))
+
+
+def read_recorded_uevents(path: str) -> Iterator[Tuple[Dict[str, str], Optional[float]]]:
+    """Yield (properties, kernel timestamp) from `udevadm monitor --kernel --property` output.
+
+    Blocks are separated by blank lines; UDEV blocks repeat the kernel's and are skipped.
+    --watch-record writes the same format.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        blocks = f.read().split("\n\n")
+    for block in blocks:
+        lines = block.strip().splitlines()
+        header = UEVENT_HEADER_RE.match(lines[0]) if lines else None
+        if header and header.group(1) == "UDEV":
+            continue
+        props = parse_uevent("\n".join(lines))
+        if props.get("ACTION") and props.get("DEVPATH"):
+            yield props, float(header.group(2)) if header else None
+
+
+def format_recorded_uevent(props: Dict[str, str], ts: float) -> str:
+    header = f"KERNEL[{ts:.6f}] {props.get('ACTION', ''):<8} {props.get('DEVPATH', '')} ({props.get('SUBSYSTEM', '')})"
+    return "\n".join([header] + [f"{k}={v}" for k, v in props.items()]) + "\n\n"
+
+
+class UsbWatcher:
+    """In-memory USB nodes (keyed by sysfs name) kept current from uevents.
+
+    apply() takes one uevent and returns the deltas it caused: "add" and "remove" with the
+    node, "change" with {field: [old, new]}, each with its depth in the tree. A node's fields come from sysfs when
+    `read_sysfs` is set (live watching) and from the uevent itself, so recorded events
+    replay without the hardware.
+    """
+
+    def __init__(self, base: str = USB_SYSFS_DIR, read_sysfs: bool = True):
+        self.base = base
+        self.read_sysfs = read_sysfs
+        self.nodes: Dict[str, Dict[str, object]] = {}
+        self.mtimes: Dict[str, int] = {}
+
+    def _stat_nodes(self) -> Dict[str, int]:
+        mtimes: Dict[str, int] = {}
+        for name in (os.listdir(self.base) if os.path.isdir(self.base) else []):
+            try:
+                mtimes[name] = os.stat(os.path.join(self.base, name)).st_mtime_ns
+            except OSError:
+                continue
+        return mtimes
+
+    def snapshot(self) -> None:
+        self.mtimes = self._stat_nodes()
+        for name in self.mtimes:
+            dev = read_usb_sysfs_node(self.base, name)
+            if dev is not None:
+                self.nodes[name] = self._describe(dev)
+
+    @staticmethod
+    def _describe(node: Dict[str, object]) -> Dict[str, object]:
+        desc = usb_ids_desc(node.get("idVendor"), node.get("idProduct"))
+        if desc:
+            node["lsusb_desc"] = desc
+        return node
+
+    def depth(self, name: str) -> int:
+        depth = 0
+        parent = usb_parent_name(name)
+        while parent is not None:
+            depth += parent in self.nodes
+            parent = usb_parent_name(parent)
+        return depth
+
+    def apply(self, props: Dict[str, str]) -> List[Dict[str, object]]:
+        if props.get("SUBSYSTEM") != "usb" or not props.get("DEVPATH"):
+            return []
+        name = os.path.basename(props["DEVPATH"])
+        action = props.get("ACTION", "")
+        if action == "remove":
+            # the kernel removes interfaces and downstream devices first; drop any it skipped,
+            # deepest first
+            gone = sorted(((self.depth(n), _usb_sort_key(n), n) for n in self.nodes if n == name or self._is_below(n, name)), reverse=True)
+            return [{"action": "remove", "name": n, "depth": depth, "node": self.nodes.pop(n)} for depth, _, n in gone]
+        old = self.nodes.get(name)
+        node: Dict[str, object] = dict(old or {"name": name})
+        if self.read_sysfs:
+            node.update(read_usb_sysfs_node(self.base, name) or {})
+        node.update(usb_fields_from_uevent(props))
+        # DRIVER is present in every uevent of a bound node, so its absence means unbound
+        if "DRIVER" not in props:
+            node.pop("driver", None)
+        self.nodes[name] = node = self._describe(node)
+        if old is None:
+            return [{"action": "add", "name": name, "depth": self.depth(name), "node": node}]
+        changes = {k: [old.get(k), node.get(k)] for k in sorted(set(old) | set(node)) if k != "path" and old.get(k) != node.get(k)}
+        return [{"action": "change", "name": name, "depth": self.depth(name), "node": node, "changes": changes}] if changes else []
+
+    @staticmethod
+    def _is_below(name: str, ancestor: str) -> bool:
+        parent = usb_parent_name(name)
+        while parent is not None:
+            if parent == ancestor:
+                return True
+            parent = usb_parent_name(parent)
+        return False
+
+    def poll(self) -> List[Dict[str, str]]:
+        """Synthesize uevents from the directory listing and node mtimes (no-netlink fallback)."""
+        current = self._stat_nodes()
+        events: List[Dict[str, str]] = []
+        for name in sorted(self.nodes.keys() - current.keys(), key=_usb_sort_key, reverse=True):
+            events.append({"ACTION": "remove", "SUBSYSTEM": "usb", "DEVPATH": name})
+        for name in sorted(current, key=_usb_sort_key):
+            if self.mtimes.get(name) != current[name] or name not in self.nodes:
+                props = read_uevent(os.path.join(self.base, name))
+                props.update({"ACTION": "change" if name in self.nodes else "add", "SUBSYSTEM": "usb", "DEVPATH": name})
+                events.append(props)
+        self.mtimes = current
+        return events
+
+
+def format_watch_delta(delta: Dict[str, object], stamp: str) -> str:
+    indent = "  " * int(delta.get("depth") or 0)
+    if delta["action"] == "change":
+        changes = ", ".join(f"{k}: {old if old is not None else '-'} -> {new if new is not None else '-'}"
+                            for k, (old, new) in delta["changes"].items())
+        return f"{stamp}  ~ {indent}{delta['name']}  {changes}"
+    sign = "+" if delta["action"] == "add" else "-"
+    return f"{stamp}  {sign} {indent}{format_usb_node(delta['node'])}"
+
+
+def open_uevent_socket() -> Optional[socket.socket]:
+    try:
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_KOBJECT_UEVENT)
+        sock.bind((0, 1))  # group 1: events straight from the kernel
+        return sock
+    except (AttributeError, OSError):
+        return None
+
+
+def run_watch(args) -> None:
+    """--watch: print USB add/remove/change deltas with timestamps until Ctrl-C.
+
+    Listens on a netlink uevent socket, or polls sysfs every --watch-interval seconds
+    when netlink is unavailable. --watch-replay feeds a recorded event file instead,
+    starting from an empty tree and stamping deltas with the recorded kernel time.
+    """
+    def emit(watcher: UsbWatcher, props: Dict[str, str], stamp: str) -> None:
+        for delta in watcher.apply(props):
+            if args.json:
+                print(json.dumps({"time": stamp, **delta}, ensure_ascii=False), flush=True)
+            else:
+                print(format_watch_delta(delta, stamp), flush=True)
+
+    if args.watch_replay:
+        watcher = UsbWatcher(read_sysfs=False)
+        for props, ts in read_recorded_uevents(args.watch_replay):
+            emit(watcher, props, f"{ts:.6f}" if ts is not None else "-")
+        return
+
+    def now() -> str:
+        return datetime.now().strftime("%H:%M:%S.%f")[:-3]
+
+    watcher = UsbWatcher()
+    watcher.snapshot()
+    sock = open_uevent_socket()
+    record = open(args.watch_record, "a", encoding="utf-8") if args.watch_record else None
+    if not args.json:
+        how = "netlink uevents" if sock else f"sysfs polling every {args.watch_interval:g}s"
+        print(f"{now()}  watching {len(watcher.nodes)} USB node(s) via {how}; Ctrl-C to stop", flush=True)
+    try:
+        while True:
+            if sock:
+                props = parse_netlink_uevent(sock.recv(65536))
+                events = [props] if props else []
+            else:
+                time.sleep(args.watch_interval)
+                events = watcher.poll()
+            for props in events:
+                if record and props.get("SUBSYSTEM") == "usb":
+                    record.write(format_recorded_uevent(props, time.monotonic()))
+                    record.flush()
+                emit(watcher, props, now())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if sock:
+            sock.close()
+        if record:
+            record.close()
+
+
 # ---------------- Serial test helpers -----------------
 
 def _read_sysfs_id_from_tty(tty_name: str) -> Optional[Tuple[str, str, str]]:
     """Given tty device name (e.g. ttyUSB0, ttyACM0) return (devpath, idVendor, idProduct)
     by walking /sys/class/tty/<tty>/device upwards until idVendor/idProduct are found.
     """
-    base = f"/sys/class/tty/{tty_name}/device"
+    base = os.path.join(SYSFS_ROOT, "class", "tty", tty_name, "device")
     if not os.path.exists(base):
         return None
     p = os.path.realpath(base)
@@ -447,7 +920,7 @@ def find_ttys_by_vidpid(vidpid_list: List[Tuple[str, str]]) -> List[Dict[str, st
     """
     found: List[Dict[str, str]] = []
     candidates = []
-    for d in os.listdir("/dev"):
+    for d in os.listdir(DEV_DIR):
         if d.startswith("ttyUSB") or d.startswith("ttyACM"):
             candidates.append(d)
     for tty in sorted(candidates):
@@ -457,7 +930,7 @@ def find_ttys_by_vidpid(vidpid_list: List[Tuple[str, str]]) -> List[Dict[str, st
         devpath, vid, pid = info
         for want_vid, want_pid in vidpid_list:
             if vid == want_vid.lower() and pid == want_pid.lower():
-                found.append({"tty": f"/dev/{tty}", "devpath": devpath, "vid": vid, "pid": pid})
+                found.append({"tty": os.path.join(DEV_DIR, tty), "devpath": devpath, "vid": vid, "pid": pid})
                 break
     return found
 
@@ -473,73 +946,275 @@ def _checksum_xor(b: bytes) -> int:
     return x & 0xFF
 
 
-def _open_write_read_tty(fd_path: str, baud: int, write_bytes: bytes, timeout: float) -> bytes:
-    """Write then read from tty. Prefer pyserial if available, otherwise use termios+select.
-    Returns the bytes read (may be empty).
+# CH9329-style control protocol: 57 AB <addr> <cmd> <len> <data...> <checksum>, the checksum
+# being the low byte of the sum of all preceding bytes. A reply carries cmd | 0x80, an
+# error reply cmd | 0xC0 with a one-byte status.
+FRAME_HEADER = b"\x57\xab"
+FRAME_MAX_DATA = 64
+CMD_GET_INFO = 0x01
+FRAME_STATUS = {
+    0x00: "success",
+    0xE1: "timeout",
+    0xE2: "header error",
+    0xE3: "command error",
+    0xE4: "checksum error",
+    0xE5: "parameter error",
+    0xE6: "operation failed",
+}
+
+
+def encode_frame(cmd: int, data: bytes = b"", addr: int = 0x00, checksum: Optional[Callable[[bytes], int]] = None) -> bytes:
+    body = FRAME_HEADER + bytes([addr, cmd, len(data)]) + data
+    return body + bytes([(checksum or _checksum_sum)(body)])
+
+
+class FrameDecoder:
+    """Incremental decoder for 57 AB frames.
+
+    feed() takes any slice of the byte stream and returns the frames it completed, so
+    frames may be split across reads or several may arrive in one. Bytes outside a frame
+    are skipped as noise; a header with an impossible length or a frame whose checksum
+    does not match is dropped and decoding resumes right after its header.
     """
-    try:
-        import serial as _pyserial  # type: ignore
-    except Exception:
-        _pyserial = None
 
-    if _pyserial:
-        try:
-            with _pyserial.Serial(fd_path, baudrate=baud, timeout=timeout) as s:
-                s.reset_input_buffer()
-                s.reset_output_buffer()
-                s.write(write_bytes)
-                s.flush()
-                data = s.read(256)
-                return data or b""
-        except Exception:
-            # fall through to termios fallback
-            pass
+    def __init__(self, checksum: Optional[Callable[[bytes], int]] = None):
+        self.checksum = checksum or _checksum_sum
+        self.buf = bytearray()
+        self.frames = 0
+        self.checksum_errors = 0
+        self.length_errors = 0
+        self.noise_bytes = 0
+
+    def _skip(self, count: int) -> None:
+        self.noise_bytes += count
+        del self.buf[:count]
+
+    def feed(self, data: bytes) -> List[Dict[str, object]]:
+        self.buf += data
+        frames: List[Dict[str, object]] = []
+        while True:
+            start = self.buf.find(FRAME_HEADER)
+            if start < 0:
+                # a trailing 0x57 may be the first half of the next header
+                self._skip(len(self.buf) - (1 if self.buf.endswith(FRAME_HEADER[:1]) else 0))
+                return frames
+            self._skip(start)
+            if len(self.buf) < 5:
+                return frames
+            length = self.buf[4]
+            if length > FRAME_MAX_DATA:
+                self.length_errors += 1
+                self._skip(len(FRAME_HEADER))
+                continue
+            if len(self.buf) < 6 + length:
+                return frames
+            raw = bytes(self.buf[:6 + length])
+            if self.checksum(raw[:-1]) != raw[-1]:
+                self.checksum_errors += 1
+                self._skip(len(FRAME_HEADER))
+                continue
+            del self.buf[:6 + length]
+            self.frames += 1
+            frames.append({"addr": raw[2], "cmd": raw[3], "data": raw[5:-1], "raw": raw})
+
+    def stats(self) -> Dict[str, int]:
+        return {"frames": self.frames, "checksum_errors": self.checksum_errors,
+                "length_errors": self.length_errors, "noise_bytes": self.noise_bytes}
+
+
+def describe_frame(frame: Dict[str, object]) -> Dict[str, object]:
+    """JSON-friendly fields of a decoded frame; GET_INFO replies get chip version, USB and LED status."""
+    cmd = int(frame["cmd"])
+    data = bytes(frame["data"])
+    info: Dict[str, object] = {"addr": f"0x{int(frame['addr']):02x}", "cmd": f"0x{cmd:02x}", "data_hex": data.hex()}
+    if cmd & 0xC0 == 0xC0 and len(data) == 1:
+        info["status"] = FRAME_STATUS.get(data[0], f"0x{data[0]:02x}")
+    elif cmd == CMD_GET_INFO | 0x80 and len(data) >= 3:
+        # 0x30 is V1.0, 0x31 V1.1, ...
+        info["chip_version"] = f"V1.{data[0] - 0x30}" if 0x30 <= data[0] <= 0x39 else f"0x{data[0]:02x}"
+        info["usb_connected"] = data[1] == 0x01
+        info["num_lock"] = bool(data[2] & 0x01)
+        info["caps_lock"] = bool(data[2] & 0x02)
+        info["scroll_lock"] = bool(data[2] & 0x04)
+    return info
+
+
+def format_frame(info: Dict[str, object]) -> str:
+    if "chip_version" in info:
+        leds = [name for name in ("num_lock", "caps_lock", "scroll_lock") if info.get(name)]
+        return (f"chip {info['chip_version']}, target USB {'connected' if info['usb_connected'] else 'not connected'}"
+                + (f", LEDs: {' '.join(leds)}" if leds else ""))
+    if "status" in info:
+        return f"cmd {info['cmd']} error: {info['status']}"
+    return f"cmd {info['cmd']} data {info['data_hex'] or '-'}"
+
+
+def _info_reply(version: int = 0x31, usb: int = 0x01, leds: int = 0x00) -> bytes:
+    return encode_frame(CMD_GET_INFO | 0x80, bytes([version, usb, leds, 0, 0, 0, 0, 0]))
+
+
+# Byte streams for --self-test: (name, stream, commands decoded in order, checksum errors, length errors)
+FRAME_FIXTURES: List[Tuple[str, bytes, List[int], int, int]] = [
+    ("info reply", _info_reply(), [0x81], 0, 0),
+    ("two replies back to back", _info_reply() + encode_frame(0xC1, b"\xe4"), [0x81, 0xC1], 0, 0),
+    ("noise and a stray 0x57 first", b"\x00\xff\x57\x57" + _info_reply(leds=0x02), [0x81], 0, 0),
+    ("bad checksum, then a good frame", _info_reply()[:-1] + b"\x00" + _info_reply(), [0x81], 1, 0),
+    ("header with impossible length", b"\x57\xab\x00\x81\xff" + _info_reply(), [0x81], 0, 1),
+    ("header bytes inside the data", encode_frame(0x82, b"\x57\xab\x57"), [0x82], 0, 0),
+    ("truncated frame", _info_reply()[:-3], [], 0, 0),
+]
+
+
+def check_frame_decoder() -> List[str]:
+    """Feed every fixture whole, one byte at a time and split at every offset; returns failures."""
+    failures: List[str] = []
+    for name, stream, cmds, checksum_errors, length_errors in FRAME_FIXTURES:
+        feeds = [[stream], [stream[i:i + 1] for i in range(len(stream))]]
+        feeds += [[stream[:cut], stream[cut:]] for cut in range(1, len(stream))]
+        for chunks in feeds:
+            decoder = FrameDecoder()
+            got = [int(f["cmd"]) for chunk in chunks for f in decoder.feed(chunk)]
+            if (got, decoder.checksum_errors, decoder.length_errors) != (cmds, checksum_errors, length_errors):
+                failures.append(f"{name} in {len(chunks)} chunk(s): cmds {got}, checksum errors {decoder.checksum_errors}, "
+                                f"length errors {decoder.length_errors}")
+                break
+    return failures
 
-    # termios fallback
-    import termios
-    import fcntl
-    import select
 
-    fd = os.open(fd_path, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
-    try:
-        attrs = termios.tcgetattr(fd)
-        # set raw, 8N1
-        attrs[2] = attrs[2] | termios.CLOCAL | termios.CREAD
-        attrs[3] = 0
-        # if possible set baud (guard for platforms where cfsetispeed is not available)
-        baud_map = {
-            9600: termios.B9600,
-            19200: termios.B19200,
-            38400: termios.B38400,
-            57600: termios.B57600,
-            115200: termios.B115200,
-        }
-        if baud in baud_map:
+class ProbeSession:
+    """A tty opened once for a whole probe.
+
+    The baud rate is switched in place (pyserial's baudrate or tcsetattr) instead of
+    reopening the device, and transact() returns as soon as a complete response frame
+    has decoded rather than waiting out the timeout. Uses pyserial when installed,
+    otherwise termios with a non-blocking fd.
+    """
+
+    def __init__(self, path: str, baud: int):
+        self.path = path
+        self.baud = baud
+        self.serial = None
+        self.fd: Optional[int] = None
+        try:
+            import serial as _pyserial  # type: ignore
+        except Exception:
+            _pyserial = None
+        if _pyserial:
             try:
-                termios.cfsetispeed(attrs, baud_map[baud])
-                termios.cfsetospeed(attrs, baud_map[baud])
+                self.serial = _pyserial.Serial(path, baudrate=baud, timeout=0)
             except Exception:
-                # some Python builds/platforms lack cfsetispeed bindings — continue without raising
-                pass
-        termios.tcsetattr(fd, termios.TCSANOW, attrs)
-
-        # write
-        os.write(fd, write_bytes)
-        # wait for response up to timeout
-        r, _, _ = select.select([fd], [], [], timeout)
-        out = b""
-        if r:
+                # fall through to termios fallback
+                self.serial = None
+        if self.serial is None:
+            self.fd = os.open(path, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
             try:
-                out = os.read(fd, 4096)
+                self._configure(baud)
             except Exception:
-                out = b""
-        return out or b""
-    finally:
+                os.close(self.fd)
+                raise
+
+    def _configure(self, baud: int) -> None:
+        import termios
+
+        attrs = termios.tcgetattr(self.fd)
+        # raw 8N1: no CR/LF translation, echo, signals or flow control on binary frames
+        attrs[0] &= ~(termios.IGNBRK | termios.BRKINT | termios.PARMRK | termios.ISTRIP | termios.INLCR
+                      | termios.IGNCR | termios.ICRNL | termios.IXON | termios.IXOFF)
+        attrs[1] &= ~termios.OPOST
+        attrs[2] = (attrs[2] & ~(termios.CSIZE | termios.PARENB | termios.CSTOPB)) | termios.CS8 | termios.CLOCAL | termios.CREAD
+        attrs[3] = 0
+        attrs[6][termios.VMIN] = 0
+        attrs[6][termios.VTIME] = 0
+        speed = getattr(termios, f"B{baud}", None)
+        if speed is not None:
+            # guard for platforms where the speed fields are not settable
+            attrs[4] = attrs[5] = speed
+        termios.tcsetattr(self.fd, termios.TCSANOW, attrs)
+
+    def set_baud(self, baud: int) -> None:
+        if baud == self.baud:
+            return
+        if self.serial is not None:
+            self.serial.baudrate = baud
+        else:
+            self._configure(baud)
+        self.baud = baud
+
+    def fileno(self) -> int:
+        return self.serial.fileno() if self.serial is not None else self.fd
+
+    def read_available(self) -> bytes:
+        if self.serial is not None:
+            return self.serial.read(self.serial.in_waiting or 1)
         try:
-            os.close(fd)
+            return os.read(self.fd, 4096)
+        except BlockingIOError:
+            return b""
+
+    def write(self, data: bytes) -> None:
+        if self.serial is not None:
+            self.serial.write(data)
+            self.serial.flush()
+            return
+        view = memoryview(data)
+        while view:
+            try:
+                view = view[os.write(self.fd, view):]
+            except BlockingIOError:
+                select.select([], [self.fd], [], 0.1)
+
+    def discard_input(self) -> None:
+        if self.serial is not None:
+            self.serial.reset_input_buffer()
+        else:
+            import termios
+
+            termios.tcflush(self.fd, termios.TCIFLUSH)
+
+    def transact(self, msg: bytes, timeout: float, checksum: Optional[Callable[[bytes], int]] = None) -> Tuple[bytes, Optional[Dict[str, object]]]:
+        """Send `msg` and read without blocking until a valid frame decodes or `timeout` passes.
+
+        Returns every byte read and the first frame (None when none arrived in time).
+        """
+        self.discard_input()
+        self.write(msg)
+        decoder = FrameDecoder(checksum)
+        deadline = time.monotonic() + timeout
+        buf = b""
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return buf, None
+            ready, _, _ = select.select([self.fileno()], [], [], remaining)
+            if not ready:
+                continue
+            chunk = self.read_available()
+            buf += chunk
+            frames = decoder.feed(chunk)
+            if frames:
+                return buf, frames[0]
+
+    def close(self) -> None:
+        try:
+            if self.serial is not None:
+                self.serial.close()
+            elif self.fd is not None:
+                os.close(self.fd)
         except Exception:
             pass
 
+    def __enter__(self) -> "ProbeSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _open_write_read_tty(fd_path: str, baud: int, write_bytes: bytes, timeout: float) -> bytes:
+    """One-shot write then read; returns the bytes read (may be empty)."""
+    with ProbeSession(fd_path, baud) as session:
+        return session.transact(write_bytes, timeout)[0]
+
 
 def _determine_baud_sequence(vid: Optional[str], pid: Optional[str], args) -> List[int]:
     """Return an ordered list of baud rates to try for a device.
@@ -562,6 +1237,83 @@ def _determine_baud_sequence(vid: Optional[str], pid: Optional[str], args) -> Li
     return [115200]
 
 
+SERIAL_PROBE_PAYLOAD = bytes([0x57, 0xAB, 0x00, 0x01, 0x00])
+
+
+def resolve_serial_targets(args) -> Tuple[List[Tuple[str, str]], List[Dict[str, str]]]:
+    """Return the VID:PID list to look for and the ttys to test (non-interactive).
+
+    --serial-tty forces one tty, with its VID:PID looked up in sysfs (best-effort);
+    otherwise every /dev/ttyUSB*/ttyACM* matching --serial-vidpid.
+    """
+    if args.serial_vidpid:
+        vidpid_list = []
+        for p in args.serial_vidpid.split(","):
+            if ":" in p:
+                a, b = p.split(":", 1)
+                vidpid_list.append((a.strip().lower(), b.strip().lower()))
+    else:
+        vidpid_list = [("1a86", "fe0c"), ("1a86", "7523")]
+    if not args.serial_tty:
+        return vidpid_list, find_ttys_by_vidpid(vidpid_list)
+    info = _read_sysfs_id_from_tty(os.path.basename(args.serial_tty))
+    devpath, vid, pid = info if info else ("", "", "")
+    return vidpid_list, [{"tty": args.serial_tty, "devpath": devpath, "vid": vid, "pid": pid}]
+
+
+def _probe_serial_device(dev: Dict[str, str], args) -> Dict[str, object]:
+    """Probe one tty: every baud from _determine_baud_sequence(), sum checksum first, then XOR."""
+    tty = dev.get("tty")
+    vid = dev.get("vid")
+    pid = dev.get("pid")
+    entry: Dict[str, object] = {"tty": tty, "vid": vid, "pid": pid, "attempts": []}
+    start = time.perf_counter()
+    ok = False
+    bauds = _determine_baud_sequence(vid, pid, args)
+    try:
+        session = ProbeSession(tty, bauds[0])
+    except Exception as e:
+        session = None
+        entry["attempts"].append({"baud": bauds[0], "method": "open", "error": str(e), "success": False})
+    # one open tty for every baud/checksum attempt; the baud is switched in place
+    for baud in (bauds if session else []):
+        for method, checksum in (("sum", _checksum_sum), ("xor", _checksum_xor)):
+            msg = SERIAL_PROBE_PAYLOAD + bytes([checksum(SERIAL_PROBE_PAYLOAD)])
+            sent = time.perf_counter()
+            try:
+                session.set_baud(baud)
+                resp, frame = session.transact(msg, args.serial_timeout, checksum)
+                # only a frame with a valid length and checksum counts; bytes alone may be line noise
+                ok = frame is not None
+                attempt = {"baud": baud, "method": method, "msg": msg.hex(), "resp_hex": resp.hex() if resp else "", "success": ok,
+                           "ms": round((time.perf_counter() - sent) * 1000, 1)}
+                if frame:
+                    attempt["frame"] = describe_frame(frame)
+                entry["attempts"].append(attempt)
+            except Exception as e:
+                entry["attempts"].append({"baud": baud, "method": method, "error": str(e), "success": False})
+            if ok:
+                break
+        if ok:
+            break
+    if session:
+        session.close()
+    entry["ok"] = ok
+    entry["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    if not ok:
+        entry.setdefault("advice", []).append("If there is no response, check that the correct driver is installed (e.g. CH34x/CDC) and verify /dev permissions.")
+    return entry
+
+
+def probe_serial_devices(ttys: List[Dict[str, str]], args) -> List[Dict[str, object]]:
+    """Probe all candidate ttys at once, one thread each, so the test takes as long as the
+    slowest device; results keep the order of `ttys`."""
+    if not ttys:
+        return []
+    with ThreadPoolExecutor(max_workers=len(ttys)) as pool:
+        return list(pool.map(lambda dev: _probe_serial_device(dev, args), ttys))
+
+
 # Serial summary printer (concise) 
 def _print_serial_summary(report: Dict[str, object]) -> None:
     st = report.get("serial_test")
@@ -580,6 +1332,8 @@ def _print_serial_summary(report: Dict[str, object]) -> None:
                 b = a.get("baud")
                 prefix = f"[baud={b}] " if b else ""
                 print(f"  {prefix}response: {a.get('resp_hex')}")
+                if a.get("frame"):
+                    print(f"  {format_frame(a['frame'])}")
                 shown = True
                 break
         if not shown:
@@ -615,16 +1369,56 @@ def pretty_print_usb_tree(nodes: List[Dict[str, object]], indent: str = "") -> N
         print(s)
 
 
-def build_report(include_modules: bool = True, include_pci: bool = True, include_usb: bool = True, usb_force_sysfs: bool = False) -> Dict[str, object]:
-    report: Dict[str, object] = {}
-    report["distro"] = get_distro_info()
-    report["kernel"] = get_kernel_info()
+def _timed_call(fn: Callable[[], Dict[str, object]]) -> Tuple[Dict[str, object], float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def build_report(include_modules: bool = True, include_pci: bool = True, include_usb: bool = True, usb_force_sysfs: bool = False,
+                 timeout: float = COLLECTOR_TIMEOUT, fast: bool = False) -> Dict[str, object]:
+    """Run the collectors concurrently, so the report takes as long as the slowest one.
+
+    Every collector gets `timeout` seconds from the start; one that times out or raises
+    is replaced by an empty result with a "reason". report["timings"] holds the
+    milliseconds spent per collector plus the wall-clock "total". With `fast` nothing is
+    forked: modules, PCI and USB come from /proc/modules and sysfs.
+    """
+    # (report key, collector, placeholder used when the collector fails)
+    collectors: List[Tuple[str, Callable[[], Dict[str, object]], Dict[str, object]]] = [
+        ("distro", get_distro_info, {"pretty": "Unknown", "raw": {}}),
+        ("kernel", lambda: get_kernel_info(fast=fast), {}),
+    ]
     if include_modules:
-        report["modules"] = get_loaded_modules()
+        collectors.append(("modules", get_loaded_modules_fast if fast else get_loaded_modules, {"source": "none", "modules": []}))
     if include_pci:
-        report["pci"] = get_pci_info()
+        collectors.append(("pci", get_pci_info_fast if fast else get_pci_info, {"available": False}))
     if include_usb:
-        report["usb"] = get_usb_tree(force_sysfs=usb_force_sysfs)
+        usb = get_usb_tree_fast if fast else (lambda: get_usb_tree(force_sysfs=usb_force_sysfs))
+        collectors.append(("usb", usb, {"source": "none", "tree": []}))
+
+    report: Dict[str, object] = {}
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+    deadline = start + timeout
+    pool = ThreadPoolExecutor(max_workers=len(collectors))
+    try:
+        futures = [(key, pool.submit(_timed_call, fn), fallback) for key, fn, fallback in collectors]
+        for key, future, fallback in futures:
+            try:
+                report[key], elapsed = future.result(timeout=max(0.0, deadline - time.perf_counter()))
+            except FutureTimeout:
+                report[key] = {**fallback, "reason": f"timed out after {timeout:g}s"}
+                elapsed = (time.perf_counter() - start) * 1000
+            except Exception as e:
+                report[key] = {**fallback, "reason": f"{type(e).__name__}: {e}"}
+                elapsed = (time.perf_counter() - start) * 1000
+            timings[key] = round(elapsed, 1)
+    finally:
+        # don't block on a collector that timed out; run_cmd() kills its tool eventually
+        pool.shutdown(wait=False)
+    timings["total"] = round((time.perf_counter() - start) * 1000, 1)
+    report["timings"] = timings
     return report
 
 
@@ -698,7 +1492,7 @@ def render_human_report(report: Dict[str, object], args) -> str:
     # get loaded module info for drivers we found (best-effort)
     module_map = {}
     try:
-        lm = report.get('modules') or get_loaded_modules()
+        lm = report.get('modules') or (get_loaded_modules_fast() if getattr(args, "fast", False) else get_loaded_modules())
         for m in lm.get("modules", []):
             module_map[m.get("module")] = m
     except Exception:
@@ -766,6 +1560,8 @@ def render_human_report(report: Dict[str, object], args) -> str:
                 prefix = f"[baud={b}] " if b else ""
                 if a.get('success'):
                     lines.append(f"     • {prefix}{meth}: response={a.get('resp_hex')}")
+                    if a.get('frame'):
+                        lines.append(f"       {format_frame(a['frame'])}")
                 else:
                     if a.get('resp_hex'):
                         lines.append(f"     • {prefix}{meth}: no success, resp={a.get('resp_hex')}")
@@ -776,6 +1572,12 @@ def render_human_report(report: Dict[str, object], args) -> str:
             for adv in dev.get('advice', []):
                 lines.append(f"     Advice: {adv}")
 
+    timings = report.get('timings') or {}
+    if timings:
+        per = ", ".join(f"{k} {v:.0f} ms" for k, v in timings.items() if k != "total")
+        lines.append("")
+        lines.append(f"collected in {timings.get('total', 0):.0f} ms ({per})")
+
     return "\n".join(lines)
 
 
@@ -784,7 +1586,8 @@ def execute_actions(args) -> None:
     Extracted so the interactive menu can call it repeatedly.
     """
     # (debug prints removed)
-    report = build_report(include_modules=args.modules, include_pci=args.pci, include_usb=args.usb, usb_force_sysfs=args.usb_sysfs)
+    report = build_report(include_modules=args.modules, include_pci=args.pci, include_usb=args.usb, usb_force_sysfs=args.usb_sysfs,
+                          timeout=getattr(args, "collector_timeout", COLLECTOR_TIMEOUT), fast=getattr(args, "fast", False))
 
     # If caller requested interactive serial-only (menu option 2), run a minimal probe
     # and print ONLY the serial summary — do not show other inspect output.
@@ -859,50 +1662,7 @@ def execute_actions(args) -> None:
             _print_serial_summary({"serial_test": results})
             return
 
-        probe_payload = bytes([0x57, 0xAB, 0x00, 0x01, 0x00])
-        for dev in ttys:
-            tty = dev.get("tty")
-            vid = dev.get("vid")
-            pid = dev.get("pid")
-            entry: Dict[str, object] = {"tty": tty, "vid": vid, "pid": pid, "attempts": []}
-
-            # select baud sequence according to VID:PID (or honor explicit --serial-baud)
-            baud_seq = _determine_baud_sequence(vid, pid, args)
-            ok = False
-            for baud in baud_seq:
-                # try checksum = sum
-                cs = _checksum_sum(probe_payload)
-                msg = probe_payload + bytes([cs])
-                try:
-                    resp = _open_write_read_tty(tty, baud, msg, args.serial_timeout)
-                    ok = bool(resp)
-                    entry["attempts"].append({"baud": baud, "method": "sum", "msg": msg.hex(), "resp_hex": resp.hex() if resp else "", "success": ok})
-                except Exception as e:
-                    entry["attempts"].append({"baud": baud, "method": "sum", "error": str(e), "success": False})
-                    resp = b""
-                    ok = False
-
-                if ok:
-                    break
-
-                # if no response, try XOR checksum as a fallback
-                cs2 = _checksum_xor(probe_payload)
-                msg2 = probe_payload + bytes([cs2])
-                try:
-                    resp2 = _open_write_read_tty(tty, baud, msg2, args.serial_timeout)
-                    ok2 = bool(resp2)
-                    entry["attempts"].append({"baud": baud, "method": "xor", "msg": msg2.hex(), "resp_hex": resp2.hex() if resp2 else "", "success": ok2})
-                    ok = ok2 or ok
-                except Exception as e:
-                    entry["attempts"].append({"baud": baud, "method": "xor", "error": str(e), "success": False})
-
-                if ok:
-                    break
-
-            entry["ok"] = ok
-            if not ok:
-                entry.setdefault("advice", []).append("If there is no response, check that the correct driver is installed (e.g. CH34x/CDC) and verify /dev permissions.")
-            results["devices"].append(entry)
+        results["devices"] = probe_serial_devices(ttys, args)
 
         # print concise serial-only summary and return
         _print_serial_summary({"serial_test": results})
@@ -910,70 +1670,15 @@ def execute_actions(args) -> None:
 
     # SERIAL test (optional)
     if getattr(args, "serial_test", False):
-        # prepare VID:PID list
-        if args.serial_vidpid:
-            vidpid_list = []
-            for p in args.serial_vidpid.split(","):
-                if ":" in p:
-                    a, b = p.split(":", 1)
-                    vidpid_list.append((a.strip().lower(), b.strip().lower()))
-        else:
-            vidpid_list = [("1a86", "fe0c"), ("1a86", "7523")]
-
+        vidpid_list, ttys_to_try = resolve_serial_targets(args)
         results: Dict[str, object] = {"targets": vidpid_list, "devices": []}
 
-        # if user forced a tty, test only that
-        ttys_to_try: List[Dict[str, str]] = []
-        if args.serial_tty:
-            # try to resolve VID/PID for the provided tty (best-effort)
-            ttyname = os.path.basename(args.serial_tty)
-            info = _read_sysfs_id_from_tty(ttyname)
-            if info:
-                _, vid, pid = info
-            else:
-                vid = pid = ""
-            ttys_to_try = [{"tty": args.serial_tty, "devpath": info[0] if info else "", "vid": vid, "pid": pid}]
-        else:
-            found = find_ttys_by_vidpid(vidpid_list)
-            ttys_to_try = found
-
         # if nothing found, still attempt to list probable ttys for user
         if not ttys_to_try:
             results["note"] = "no matching /dev/ttyUSB* or /dev/ttyACM* found for requested VID:PID"
             report["serial_test"] = results
         else:
-            probe_payload = bytes([0x57, 0xAB, 0x00, 0x01, 0x00])
-            for dev in ttys_to_try:
-                tty = dev.get("tty")
-                entry: Dict[str, object] = {"tty": tty, "vid": dev.get("vid"), "pid": dev.get("pid"), "attempts": []}
-                # try checksum = sum
-                cs = _checksum_sum(probe_payload)
-                msg = probe_payload + bytes([cs])
-                try:
-                    resp = _open_write_read_tty(tty, args.serial_baud, msg, args.serial_timeout)
-                    ok = bool(resp)
-                    entry["attempts"].append({"method": "sum", "msg": msg.hex(), "resp_hex": resp.hex() if resp else "", "success": ok})
-                except Exception as e:
-                    entry["attempts"].append({"method": "sum", "error": str(e), "success": False})
-                    resp = b""
-                    ok = False
-
-                # if no response, try XOR checksum as a fallback
-                if not ok:
-                    cs2 = _checksum_xor(probe_payload)
-                    msg2 = probe_payload + bytes([cs2])
-                    try:
-                        resp2 = _open_write_read_tty(tty, args.serial_baud, msg2, args.serial_timeout)
-                        ok2 = bool(resp2)
-                        entry["attempts"].append({"method": "xor", "msg": msg2.hex(), "resp_hex": resp2.hex() if resp2 else "", "success": ok2})
-                        ok = ok2 or ok
-                    except Exception as e:
-                        entry["attempts"].append({"method": "xor", "error": str(e), "success": False})
-
-                entry["ok"] = ok
-                if not ok:
-                    entry.setdefault("advice", []).append("If there is no response, check that the correct driver is installed (e.g. CH34x/CDC) and verify /dev permissions.")
-                results["devices"].append(entry)
+            results["devices"] = probe_serial_devices(ttys_to_try, args)
             report["serial_test"] = results
 
 
@@ -1061,7 +1766,7 @@ def execute_actions(args) -> None:
         # get loaded module info for drivers we found (best-effort)
         module_map = {}
         try:
-            lm = get_loaded_modules()
+            lm = get_loaded_modules_fast() if getattr(args, "fast", False) else get_loaded_modules()
             for m in lm.get("modules", []):
                 module_map[m.get("module")] = m
         except Exception:
@@ -1100,6 +1805,8 @@ def execute_actions(args) -> None:
                     meth = a.get("method")
                     if a.get("success"):
                         print(f"     • {meth}: response={a.get('resp_hex')}")
+                        if a.get("frame"):
+                            print(f"       {format_frame(a['frame'])}")
                     else:
                         if a.get("resp_hex"):
                             print(f"     • {meth}: no success, resp={a.get('resp_hex')}")
@@ -1198,6 +1905,8 @@ def execute_actions(args) -> None:
                     meth = a.get("method")
                     if a.get("success"):
                         print(f"     • {meth}: response={a.get('resp_hex')}")
+                        if a.get("frame"):
+                            print(f"       {format_frame(a['frame'])}")
                     else:
                         if a.get("resp_hex"):
                             print(f"     • {meth}: no success, resp={a.get('resp_hex')}")
@@ -1208,6 +1917,327 @@ def execute_actions(args) -> None:
                 for adv in dev.get("advice", []):
                     print(f"     Advice: {adv}")
 
+# ---------------- Benchmarks -----------------
+
+def bench_report(args) -> Dict[str, object]:
+    """Median build_report() timings over --bench-runs runs, tool-based vs --fast."""
+    runs = max(1, args.bench_runs)
+    result: Dict[str, object] = {"bench": "report", "runs": runs}
+    for mode, fast in (("subprocess", False), ("fast", True)):
+        samples = [build_report(timeout=args.collector_timeout, fast=fast)["timings"] for _ in range(runs)]
+        result[mode] = {k: round(statistics.median(s[k] for s in samples), 1) for k in samples[0]}
+    result["speedup"] = round(result["subprocess"]["total"] / max(result["fast"]["total"], 0.1), 1)
+    return result
+
+
+def format_report_bench(result: Dict[str, object]) -> List[str]:
+    keys = list(result["subprocess"])
+    lines = [f"build_report(), median of {result['runs']} run(s), ms:",
+             f"{'':<12}" + "".join(f"{k:>9}" for k in keys)]
+    for mode in ("subprocess", "fast"):
+        lines.append(f"{mode:<12}" + "".join(f"{result[mode].get(k, 0):>9.1f}" for k in keys))
+    lines.append(f"--fast is {result['speedup']}x faster")
+    return lines
+
+
+def synthetic_usb_devices(count: int) -> Dict[str, Dict[str, object]]:
+    """Fake sysfs USB nodes for benchmarks: root hubs with chains of 4-port hubs (at most
+    5 deep, as USB allows), every device with one interface, until `count` nodes exist."""
+    devices: Dict[str, Dict[str, object]] = {}
+    bus = 0
+    while len(devices) < count:
+        bus += 1
+        for name in (f"usb{bus}", f"{bus}-0:1.0"):
+            devices[name] = {"name": name, "idVendor": "1d6b", "idProduct": "0002", "driver": "hub"}
+        hubs = deque([f"usb{bus}"])
+        while hubs and len(devices) < count:
+            hub = hubs.popleft()
+            for port in range(1, 5):
+                name = f"{bus}-{port}" if hub.startswith("usb") else f"{hub}.{port}"
+                devices[name] = {"name": name, "idVendor": "05e3", "idProduct": "0610", "driver": "usb"}
+                devices[f"{name}:1.0"] = {"name": f"{name}:1.0", "driver": "hub"}
+                if name.count(".") < 4:
+                    hubs.append(name)
+    return devices
+
+
+def bench_usb_tree(args) -> Dict[str, object]:
+    """Median build_usb_tree() time on synthetic trees of 1/4, 1/2 and all of --bench-nodes."""
+    runs = max(1, args.bench_runs)
+    result: Dict[str, object] = {"bench": "usb-tree", "runs": runs, "sizes": []}
+    for count in (args.bench_nodes // 4, args.bench_nodes // 2, args.bench_nodes):
+        devices = synthetic_usb_devices(max(count, 1))
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            roots = build_usb_tree(devices)
+            samples.append((time.perf_counter() - start) * 1000)
+
+        def _count(nodes: List[Dict[str, object]]) -> int:
+            return sum(1 + _count(n["children"]) for n in nodes)
+
+        ms = statistics.median(samples)
+        result["sizes"].append({"nodes": len(devices), "linked": _count(roots), "roots": len(roots),
+                                "ms": round(ms, 2), "us_per_node": round(ms * 1000 / len(devices), 2)})
+    return result
+
+
+def format_usb_tree_bench(result: Dict[str, object]) -> List[str]:
+    lines = [f"build_usb_tree(), median of {result['runs']} run(s):"]
+    for size in result["sizes"]:
+        lines.append(f"  {size['nodes']:>7} nodes ({size['roots']} roots): {size['ms']:>8.2f} ms  "
+                     f"{size['us_per_node']:.2f} us/node")
+    return lines
+
+
+def write_synthetic_usb_sysfs(root: str, devices: Dict[str, Dict[str, object]]) -> str:
+    """Lay `devices` out like /sys/bus/usb/devices under `root` and return that directory."""
+    base = os.path.join(root, "bus", "usb", "devices")
+    os.makedirs(base)
+    for devnum, (name, dev) in enumerate(sorted(devices.items()), start=1):
+        node = os.path.join(root, "devices", name)
+        os.makedirs(node)
+        os.symlink(node, os.path.join(base, name))
+        bus = re.sub(r"^usb", "", name).split("-", 1)[0]
+        driver = str(dev.get("driver") or "usb")
+        vid, pid = str(dev.get("idVendor") or "05e3"), str(dev.get("idProduct") or "0610")
+        interface = ":" in name
+        uevent = [f"DEVTYPE={'usb_interface' if interface else 'usb_device'}", f"DRIVER={driver}",
+                  f"PRODUCT={int(vid, 16):x}/{int(pid, 16):x}/100"]
+        attrs = {"uevent": ""}
+        if not interface:
+            uevent += [f"BUSNUM={int(bus):03d}", f"DEVNUM={devnum:03d}"]
+            attrs.update({"idVendor": vid, "idProduct": pid, "manufacturer": "Synthetic", "product": "Hub",
+                          "busnum": bus, "devnum": str(devnum), "devpath": name.split("-", 1)[-1]})
+        attrs["uevent"] = "\n".join(uevent)
+        for attr, value in attrs.items():
+            with open(os.path.join(node, attr), "w", encoding="utf-8") as f:
+                f.write(value + "\n")
+        drivers = os.path.join(root, "bus", "usb", "drivers", driver)
+        os.makedirs(drivers, exist_ok=True)
+        os.symlink(drivers, os.path.join(node, "driver"))
+    return base
+
+
+def _read_usb_sysfs_per_attribute(base: str) -> int:
+    """The collector's previous read pattern (one open() per attribute), for comparison."""
+    count = 0
+    for name in os.listdir(base):
+        path = os.path.join(base, name)
+        if not os.path.isdir(path):
+            continue
+        for attr in ("idVendor", "idProduct", "manufacturer", "product", "serial", "busnum", "devnum", "devpath", "uevent"):
+            read_sysfs_attr(path, attr)
+        if os.path.islink(os.path.join(path, "driver")):
+            os.readlink(os.path.join(path, "driver"))
+        count += 1
+    return count
+
+
+_open_events: Optional[List[int]] = None
+
+
+def _audit_opens(event: str, args: Tuple[object, ...]) -> None:
+    # builtins.open() and os.open() both raise the "open" audit event
+    if event == "open" and _open_events is not None:
+        _open_events[0] += 1
+
+
+def _read_syscalls() -> Optional[int]:
+    try:
+        with open("/proc/self/io", "r", encoding="ascii") as f:
+            return int(parse_uevent(f.read().replace(": ", "=")).get("syscr", ""))
+    except Exception:
+        return None
+
+
+def bench_sysfs(args) -> Dict[str, object]:
+    """Files opened, read syscalls and time for reading every USB node, per-attribute vs batched.
+
+    Uses the USB sysfs directory when it has entries, otherwise a synthetic copy of
+    --bench-nodes // 8 nodes in a temp dir. Opens are counted with an audit hook and
+    reads from /proc/self/io (syscr).
+    """
+    global _open_events
+    import tempfile
+
+    sys.addaudithook(_audit_opens)
+    runs = max(1, args.bench_runs)
+    base = USB_SYSFS_DIR
+    tmp = None
+    if not (os.path.isdir(base) and os.listdir(base)):
+        tmp = tempfile.TemporaryDirectory(prefix="usb-sysfs-")
+        base = write_synthetic_usb_sysfs(tmp.name, synthetic_usb_devices(max(args.bench_nodes // 8, 1)))
+    nodes = len(os.listdir(base))
+    result: Dict[str, object] = {"bench": "sysfs", "runs": runs, "source": base if tmp is None else "synthetic", "nodes": nodes}
+    readers = (("per_attribute", lambda: _read_usb_sysfs_per_attribute(base)),
+               ("batched", lambda: [read_usb_sysfs_node(base, name) for name in os.listdir(base)]))
+    try:
+        for label, reader in readers:
+            samples = []
+            for _ in range(runs):
+                # two back-to-back probes measure the probe's own read syscalls
+                probe_cost = -(_read_syscalls() or 0) + (_read_syscalls() or 0)
+                reads_before = _read_syscalls()
+                _open_events = [0]
+                start = time.perf_counter()
+                reader()
+                elapsed = (time.perf_counter() - start) * 1000
+                opens = _open_events[0]
+                reads_after = _read_syscalls()
+                reads = None if reads_before is None or reads_after is None else reads_after - reads_before - probe_cost
+                samples.append((elapsed, opens, reads))
+            ms = statistics.median(x[0] for x in samples)
+            opens = samples[-1][1]
+            reads = samples[-1][2]
+            result[label] = {"ms": round(ms, 2), "opens": opens, "reads": reads,
+                             "opens_per_node": round(opens / max(nodes, 1), 2),
+                             "reads_per_node": None if reads is None else round(reads / max(nodes, 1), 2)}
+    finally:
+        _open_events = None
+        if tmp is not None:
+            tmp.cleanup()
+    return result
+
+
+def format_sysfs_bench(result: Dict[str, object]) -> List[str]:
+    lines = [f"USB sysfs reads over {result['nodes']} node(s) ({result['source']}), median of {result['runs']} run(s):"]
+    for label in ("per_attribute", "batched"):
+        r = result[label]
+        reads = "n/a" if r["reads"] is None else f"{r['reads']} reads ({r['reads_per_node']}/node)"
+        lines.append(f"  {label:<14} {r['ms']:>8.2f} ms  {r['opens']} opens ({r['opens_per_node']}/node), {reads}")
+    return lines
+
+
+# a request whose reply is this many times later than the running median is taken as lost
+BENCH_LOST_REPLY_FACTOR = 4
+BENCH_MEDIAN_SAMPLES = 64
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    # nearest-rank percentile of an already sorted list
+    return sorted_values[max(0, -(-len(sorted_values) * pct // 100) - 1)]
+
+
+def bench_serial_link(session: ProbeSession, baud: int, count: int, window: int, timeout: float) -> Dict[str, object]:
+    """Send `count` GET_INFO frames at `baud`, keeping up to `window` of them in flight.
+
+    Replies carry no sequence number, so they are matched to requests in order. A reply the
+    decoder rejects (bad checksum or length) retires the oldest request as dropped at once;
+    a reply lost outright is noticed when the oldest request has waited
+    BENCH_LOST_REPLY_FACTOR times the running median latency, or `timeout` before the first
+    replies are in. A reply arriving after its request was retired counts as late. Stops
+    early when nothing at all comes back.
+    """
+    session.set_baud(baud)
+    session.discard_input()
+    msg = encode_frame(CMD_GET_INFO)
+    decoder = FrameDecoder()
+    in_flight: deque = deque()
+    latencies: List[float] = []
+    recent: deque = deque(maxlen=BENCH_MEDIAN_SAMPLES)
+    sent = dropped = late = 0
+    reply_len = 0
+    rejected = 0
+    give_up = timeout
+    start = time.perf_counter()
+    while sent < count or in_flight:
+        while sent < count and len(in_flight) < window:
+            session.write(msg)
+            in_flight.append(time.perf_counter())
+            sent += 1
+        now = time.perf_counter()
+        while in_flight and now - in_flight[0] > give_up:
+            in_flight.popleft()
+            dropped += 1
+        if not latencies and dropped >= window:
+            break
+        if not in_flight:
+            continue
+        ready, _, _ = select.select([session.fileno()], [], [], max(0.0, in_flight[0] + give_up - now))
+        if not ready:
+            continue
+        chunk = session.read_available()
+        received_at = time.perf_counter()
+        frames = decoder.feed(chunk)
+        # the decoder only counts rejected frames, so retire their requests before matching this read's replies
+        errors = decoder.checksum_errors + decoder.length_errors
+        while rejected < errors:
+            rejected += 1
+            if in_flight:
+                in_flight.popleft()
+                dropped += 1
+        for frame in frames:
+            if int(frame["cmd"]) != CMD_GET_INFO | 0x80 or not in_flight:
+                late += 1
+                continue
+            latency = received_at - in_flight.popleft()
+            latencies.append(latency * 1000)
+            recent.append(latency)
+            reply_len = len(frame["raw"])
+        if len(recent) >= BENCH_MEDIAN_SAMPLES // 4:
+            give_up = min(timeout, BENCH_LOST_REPLY_FACTOR * statistics.median(recent))
+    elapsed = time.perf_counter() - start
+    ordered = sorted(latencies)
+    result: Dict[str, object] = {
+        "baud": baud,
+        "sent": sent,
+        "received": len(latencies),
+        "dropped": dropped,
+        "late": late,
+        "aborted": sent < count,
+        **{k: v for k, v in decoder.stats().items() if k != "frames"},
+        "elapsed_s": round(elapsed, 3),
+        "frames_per_s": round(len(latencies) / elapsed, 1) if elapsed > 0 else 0.0,
+        # 10 bits per byte on the wire (8N1); the link is full duplex, so the longer direction limits
+        "wire_limit_frames_per_s": round(baud / 10 / max(len(msg), reply_len), 1) if reply_len else None,
+    }
+    if ordered:
+        result["latency_ms"] = {
+            "min": round(ordered[0], 2),
+            "p50": round(_percentile(ordered, 50), 2),
+            "p90": round(_percentile(ordered, 90), 2),
+            "p99": round(_percentile(ordered, 99), 2),
+            "max": round(ordered[-1], 2),
+            "mean": round(statistics.mean(ordered), 2),
+        }
+    return result
+
+
+def run_serial_bench(args) -> Dict[str, object]:
+    """--serial-bench: bench_serial_link() on every serial target at each of its baud rates.
+
+    The rates are --serial-bench-bauds when given, else those _determine_baud_sequence()
+    would probe; devices are measured one after another so they don't share the bus.
+    """
+    _, ttys = resolve_serial_targets(args)
+    result: Dict[str, object] = {"frames": args.serial_bench, "window": args.serial_bench_window,
+                                 "timeout_s": args.serial_timeout, "devices": []}
+    if not ttys:
+        result["note"] = "no matching /dev/ttyUSB* or /dev/ttyACM* found for requested VID:PID"
+    for dev in ttys:
+        if args.serial_bench_bauds:
+            bauds = [int(b) for b in args.serial_bench_bauds.split(",") if b.strip()]
+        else:
+            bauds = _determine_baud_sequence(dev.get("vid"), dev.get("pid"), args)
+        entry: Dict[str, object] = {"tty": dev.get("tty"), "vid": dev.get("vid"), "pid": dev.get("pid"), "runs": []}
+        try:
+            with ProbeSession(str(dev.get("tty")), bauds[0]) as session:
+                for baud in bauds:
+                    entry["runs"].append(bench_serial_link(session, baud, args.serial_bench, max(1, args.serial_bench_window), args.serial_timeout))
+        except Exception as e:
+            entry["error"] = str(e)
+        result["devices"].append(entry)
+    return result
+
+
+# --bench name -> (runner, text formatter); --json prints the runner's dict instead
+BENCHES: Dict[str, Tuple[Callable[..., Dict[str, object]], Callable[[Dict[str, object]], List[str]]]] = {
+    "report": (bench_report, format_report_bench),
+    "usb-tree": (bench_usb_tree, format_usb_tree_bench),
+    "sysfs": (bench_sysfs, format_sysfs_bench),
+}
+
 # (moved into execute_actions)
 
 def main() -> None:
@@ -1225,11 +2255,62 @@ def main() -> None:
     ap.add_argument("--serial-tty", dest="serial_tty", metavar="TTY", help="force a specific tty (e.g. /dev/ttyACM0) for the serial test")
     ap.add_argument("--serial-baud", dest="serial_baud", type=int, default=None, help="baud rate to use for serial probe (optional). If omitted: 1a86:fe0c => 115200; 1a86:7523 => try 9600 then 115200. Explicit value overrides automatic selection.")
     ap.add_argument("--serial-timeout", dest="serial_timeout", type=float, default=1.5, help="seconds to wait for serial response")
+    ap.add_argument("--serial-bench", dest="serial_bench", type=int, nargs="?", const=200, default=None, metavar="N",
+                    help="benchmark the serial link: send N pipelined GET_INFO frames (default 200) per baud rate and print "
+                         "latency percentiles, frames/s, drops and checksum errors as JSON (to --output FILE if given)")
+    ap.add_argument("--serial-bench-window", dest="serial_bench_window", type=int, default=8, metavar="K",
+                    help="frames kept in flight by --serial-bench (default: 8; 1 = strict request/response)")
+    ap.add_argument("--serial-bench-bauds", dest="serial_bench_bauds", metavar="LIST",
+                    help="comma-separated baud rates for --serial-bench (default: the rates the serial test would try)")
     ap.add_argument("--report-full", dest="report_full", action="store_true",
                     help="generate combined report: option 1 (inspect) + serial-test; use --json/--output to save machine-readable report")
     ap.add_argument("--limit-modules", type=int, default=0, help="how many modules to show in pretty output (0 = show all)")
+    ap.add_argument("--fast", action="store_true",
+                    help="read modules, PCI and USB from /proc and /sys only (no lsmod/lspci/lsusb); USB names come from a built-in usb.ids subset")
+    ap.add_argument("--bench", nargs="?", const="report", choices=sorted(BENCHES), metavar="WHAT",
+                    help=f"run a benchmark instead of the report: {', '.join(sorted(BENCHES))} (default: report)")
+    ap.add_argument("--bench-runs", dest="bench_runs", type=int, default=5, help="runs per benchmark (default: 5)")
+    ap.add_argument("--bench-nodes", dest="bench_nodes", type=int, default=8000, help="largest synthetic USB tree for --bench usb-tree (default: 8000)")
+    ap.add_argument("--watch", action="store_true",
+                    help="watch USB hotplug: print add/remove/change deltas with timestamps until Ctrl-C (JSON lines with --json)")
+    ap.add_argument("--watch-interval", dest="watch_interval", type=float, default=1.0, metavar="SECONDS",
+                    help="sysfs polling interval when netlink uevents are unavailable (default: 1)")
+    ap.add_argument("--watch-record", dest="watch_record", metavar="FILE", help="with --watch: append the received USB uevents to FILE")
+    ap.add_argument("--watch-replay", dest="watch_replay", metavar="FILE",
+                    help="replay uevents recorded with --watch-record or `udevadm monitor --kernel --property` instead of watching")
+    ap.add_argument("--self-test", dest="self_test", action="store_true",
+                    help="check the serial frame decoder against built-in byte streams (split and concatenated frames) and exit")
+    ap.add_argument("--collector-timeout", dest="collector_timeout", type=float, default=COLLECTOR_TIMEOUT, metavar="SECONDS",
+                    help=f"give up on a collector (lsmod, lspci, lsusb, ...) after SECONDS (default: {COLLECTOR_TIMEOUT:g})")
     args = ap.parse_args()
 
+    if args.bench:
+        runner, formatter = BENCHES[args.bench]
+        result = runner(args)
+        print(json.dumps(result, indent=2) if args.json else "\n".join(formatter(result)))
+        return
+
+    if args.self_test:
+        failures = check_frame_decoder()
+        for failure in failures:
+            print(f"FAIL {failure}")
+        print(f"frame decoder: {len(FRAME_FIXTURES) - len(failures)}/{len(FRAME_FIXTURES)} fixtures OK")
+        sys.exit(1 if failures else 0)
+
+    if args.serial_bench is not None:
+        out = json.dumps({"serial_bench": run_serial_bench(args)}, indent=2)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(out + "\n")
+            print(f"Wrote serial benchmark to {args.output}")
+        else:
+            print(out)
+        return
+
+    if args.watch or args.watch_replay:
+        run_watch(args)
+        return
+
     # location of this script (used as the default directory for reports)
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -1359,74 +2440,20 @@ def main() -> None:
         execute_actions(args)
         return
 
-    report = build_report(include_modules=args.modules, include_pci=args.pci, include_usb=args.usb, usb_force_sysfs=args.usb_sysfs)
+    report = build_report(include_modules=args.modules, include_pci=args.pci, include_usb=args.usb, usb_force_sysfs=args.usb_sysfs,
+                          timeout=getattr(args, "collector_timeout", COLLECTOR_TIMEOUT), fast=getattr(args, "fast", False))
 
     # SERIAL test (optional)
     if getattr(args, "serial_test", False):
-        # prepare VID:PID list
-        if args.serial_vidpid:
-            vidpid_list = []
-            for p in args.serial_vidpid.split(","):
-                if ":" in p:
-                    a, b = p.split(":", 1)
-                    vidpid_list.append((a.strip().lower(), b.strip().lower()))
-        else:
-            vidpid_list = [("1a86", "fe0c"), ("1a86", "7523")]
-
+        vidpid_list, ttys_to_try = resolve_serial_targets(args)
         results: Dict[str, object] = {"targets": vidpid_list, "devices": []}
 
-        # if user forced a tty, test only that
-        ttys_to_try: List[Dict[str, str]] = []
-        if args.serial_tty:
-            # try to resolve VID/PID for the provided tty (best-effort)
-            ttyname = os.path.basename(args.serial_tty)
-            info = _read_sysfs_id_from_tty(ttyname)
-            if info:
-                _, vid, pid = info
-            else:
-                vid = pid = ""
-            ttys_to_try = [{"tty": args.serial_tty, "devpath": info[0] if info else "", "vid": vid, "pid": pid}]
-        else:
-            found = find_ttys_by_vidpid(vidpid_list)
-            ttys_to_try = found
-
         # if nothing found, still attempt to list probable ttys for user
         if not ttys_to_try:
             results["note"] = "no matching /dev/ttyUSB* or /dev/ttyACM* found for requested VID:PID"
             report["serial_test"] = results
         else:
-            probe_payload = bytes([0x57, 0xAB, 0x00, 0x01, 0x00])
-            for dev in ttys_to_try:
-                tty = dev.get("tty")
-                entry: Dict[str, object] = {"tty": tty, "vid": dev.get("vid"), "pid": dev.get("pid"), "attempts": []}
-                # try checksum = sum
-                cs = _checksum_sum(probe_payload)
-                msg = probe_payload + bytes([cs])
-                try:
-                    resp = _open_write_read_tty(tty, args.serial_baud, msg, args.serial_timeout)
-                    ok = bool(resp)
-                    entry["attempts"].append({"method": "sum", "msg": msg.hex(), "resp_hex": resp.hex() if resp else "", "success": ok})
-                except Exception as e:
-                    entry["attempts"].append({"method": "sum", "error": str(e), "success": False})
-                    resp = b""
-                    ok = False
-
-                # if no response, try XOR checksum as a fallback
-                if not ok:
-                    cs2 = _checksum_xor(probe_payload)
-                    msg2 = probe_payload + bytes([cs2])
-                    try:
-                        resp2 = _open_write_read_tty(tty, args.serial_baud, msg2, args.serial_timeout)
-                        ok2 = bool(resp2)
-                        entry["attempts"].append({"method": "xor", "msg": msg2.hex(), "resp_hex": resp2.hex() if resp2 else "", "success": ok2})
-                        ok = ok2 or ok
-                    except Exception as e:
-                        entry["attempts"].append({"method": "xor", "error": str(e), "success": False})
-
-                entry["ok"] = ok
-                if not ok:
-                    entry.setdefault("advice", []).append("If there is no response, check that the correct driver is installed (e.g. CH34x/CDC) and verify /dev permissions.")
-                results["devices"].append(entry)
+            results["devices"] = probe_serial_devices(ttys_to_try, args)
             report["serial_test"] = results
 
 